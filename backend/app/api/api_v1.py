@@ -4,9 +4,10 @@ API v1 router aggregation
 
 from fastapi import APIRouter
 
+from .responses import ORJSONResponse
 from .endpoints import health, csv_analysis, csv_cleaning, chat, dashboard_chat
 
-api_router = APIRouter()
+api_router = APIRouter(default_response_class=ORJSONResponse)
 
 # Include endpoint routers
 api_router.include_router(health.router, tags=["health"])
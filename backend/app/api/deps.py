@@ -0,0 +1,77 @@
+"""
+Shared dependencies for API endpoints
+"""
+
+from typing import List, Optional
+
+from fastapi import File, Form, HTTPException, UploadFile
+
+from ..config import settings
+from ..utils.file_utils import (
+    get_upload_size,
+    make_extension_set,
+    validate_file_extension,
+)
+
+# Lowercased once here rather than on every upload
+ALLOWED_EXTENSIONS = make_extension_set(settings.ALLOWED_FILE_EXTENSIONS)
+
+# Content types browsers and HTTP clients commonly send for .csv files
+ALLOWED_CSV_CONTENT_TYPES = {
+    "text/csv",
+    "application/csv",
+    "text/plain",
+    "application/vnd.ms-excel",
+    "application/octet-stream",
+}
+
+
+async def validate_csv_upload(file: UploadFile = File(...)) -> UploadFile:
+    """
+    Reject uploads that are not CSV files or exceed the size limit before any parsing
+
+    Args:
+        file: Uploaded file
+
+    Returns:
+        The same UploadFile when it passes validation
+
+    Raises:
+        HTTPException: 415 for a wrong extension or content type, 413 when the
+            file is larger than settings.MAX_FILE_SIZE
+    """
+    if not file.filename or not validate_file_extension(
+        file.filename, ALLOWED_EXTENSIONS
+    ):
+        raise HTTPException(status_code=415, detail="Only CSV files are accepted.")
+
+    content_type = (file.content_type or "").split(";")[0].strip().lower()
+    if content_type and content_type not in ALLOWED_CSV_CONTENT_TYPES:
+        raise HTTPException(
+            status_code=415, detail=f"Unsupported content type: {file.content_type}"
+        )
+
+    # Measured without reading the upload into memory, and kept on the upload
+    # so services can report it without rereading
+    if get_upload_size(file) > settings.MAX_FILE_SIZE:
+        raise HTTPException(
+            status_code=413,
+            detail=f"File too large. Maximum size is {settings.MAX_FILE_SIZE // (1024 * 1024)}MB.",
+        )
+
+    return file
+
+
+def parse_exogenous_columns(treatments: Optional[str] = Form(None)) -> List[str]:
+    """
+    Split the comma-separated treatments form field into exogenous column names
+
+    Args:
+        treatments: Comma-separated column names, or None
+
+    Returns:
+        List of stripped, non-empty column names
+    """
+    if not treatments:
+        return []
+    return [c.strip() for c in treatments.split(",") if c.strip()]
@@ -14,11 +14,21 @@ import logging
 from app.models.chat import UploadResponse, AskRequest, AskResponse
 from app.core.exceptions import ChatError, CSVProcessingError
 from app.core.agent_engine import session_manager
+from app.core.concurrency import run_cpu_bound
+from app.core.csv_processor import csv_processor
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
+def _read_upload(file: UploadFile) -> pd.DataFrame:
+    """Parse an upload for a chat session; runs on a worker thread."""
+    # The shared Arrow reader can hand back numeric columns as read-only views
+    # of its buffers, and the agent may edit df in place, so the session gets
+    # its own writable copy
+    return csv_processor.generate_df_from_upload(file).copy()
+
+
 @router.post("/upload", response_model=UploadResponse)
 async def upload_csv(
     file: UploadFile = File(..., description="The CSV file to analyze"),
@@ -34,7 +44,8 @@ async def upload_csv(
 
     # Load the CSV into a DataFrame
     try:
-        df = pd.read_csv(file.file)
+        # Parse on a worker thread so a large upload doesn't block the event loop
+        df = await run_cpu_bound(_read_upload, file)
         if df.empty:
             raise CSVProcessingError("The uploaded CSV file is empty.")
     except CSVProcessingError:
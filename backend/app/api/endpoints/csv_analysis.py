@@ -2,32 +2,45 @@
 CSV analysis endpoints
 """
 
-from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi import APIRouter, UploadFile, Depends, HTTPException
 import logging
 
-from ...services.analysis_service import AnalysisService
+from ..deps import validate_csv_upload
+from ...services.analysis_service import analysis_service
 from ...core.exceptions import CSVProcessingError
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Lowercased dtype-name prefixes counted as numeric and text columns; Arrow-backed
+# string columns report "str" or "string"
+NUMERIC_DTYPE_PREFIXES = ("int", "uint", "float")
+TEXT_DTYPE_PREFIXES = ("object", "str")
+
 
 @router.post("/analyse-csv/", response_model=dict)
-async def analyze_csv(file: UploadFile = File(...)):
+async def analyze_csv(file: UploadFile = Depends(validate_csv_upload)):
     """
     Analyze uploaded CSV file and return comprehensive information
     Uses unified analysis function that provides both basic and detailed information
     """
     try:
-        analysis_service = AnalysisService()
-
         # Get comprehensive CSV analysis (includes both basic and detailed info)
         comprehensive_result = await analysis_service.analyze_csv_comprehensive(file)
 
-        # Add additional metadata and insights
-        total_missing_values = sum(
-            col_info["null_count"] for col_info in comprehensive_result["columns_info"]
-        )
+        # Add additional metadata and insights: classify column types and total
+        # up missing values in a single pass over the column info
+        n_numeric = n_text = n_other = 0
+        total_missing_values = 0
+        for col in comprehensive_result["columns_info"]:
+            dt = col["data_type"].lower()
+            total_missing_values += col["null_count"]
+            if dt.startswith(NUMERIC_DTYPE_PREFIXES):
+                n_numeric += 1
+            elif dt.startswith(TEXT_DTYPE_PREFIXES):
+                n_text += 1
+            else:
+                n_other += 1
 
         comprehensive_result["data_quality"] = {
             "total_missing_values": total_missing_values,
@@ -46,32 +59,9 @@ async def analyze_csv(file: UploadFile = File(...)):
         }
 
         comprehensive_result["column_types"] = {
-            "numeric": len(
-                [
-                    col
-                    for col in comprehensive_result["columns_info"]
-                    if "int" in col["data_type"].lower()
-                    or "float" in col["data_type"].lower()
-                ]
-            ),
-            "text": len(
-                [
-                    col
-                    for col in comprehensive_result["columns_info"]
-                    if "object" in col["data_type"].lower()
-                ]
-            ),
-            "other": len(
-                [
-                    col
-                    for col in comprehensive_result["columns_info"]
-                    if not (
-                        "int" in col["data_type"].lower()
-                        or "float" in col["data_type"].lower()
-                        or "object" in col["data_type"].lower()
-                    )
-                ]
-            ),
+            "numeric": n_numeric,
+            "text": n_text,
+            "other": n_other,
         }
 
         comprehensive_result["insights"] = {
@@ -98,9 +88,13 @@ async def analyze_csv(file: UploadFile = File(...)):
                 "Large dataset detected - consider data sampling for initial exploration"
             )
 
-        logger.info(
-            f"Successfully analyzed CSV file: {file.filename} with {comprehensive_result['num_rows']} rows and {comprehensive_result['num_columns']} columns"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Successfully analyzed CSV file: %s with %d rows and %d columns",
+                file.filename,
+                comprehensive_result["num_rows"],
+                comprehensive_result["num_columns"],
+            )
         return comprehensive_result
 
     except CSVProcessingError as e:
@@ -2,22 +2,31 @@
 CSV Cleaning Endpoint - Specialized in removing rows with null values
 """
 
-from fastapi import APIRouter, UploadFile, File, HTTPException, Response
+from fastapi import APIRouter, UploadFile, Depends, HTTPException, Query
 from fastapi.responses import StreamingResponse
+from typing import Literal
 import logging
-import io
+import os
 
-from ...services.cleaning_service import CleaningService
-from ...services.removed_rows_service import AllRemovedRowsService
+from ..deps import validate_csv_upload
+from ...services.cleaning_service import cleaning_service
+from ...services.removed_rows_service import removed_rows_service
+from ...core.concurrency import iterate_cpu_bound, run_cpu_bound
 from ...core.exceptions import CSVProcessingError
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Media type and file extension for each cleaned-file download format
+DOWNLOAD_FORMATS = {
+    "csv": ("text/csv", ".csv"),
+    "arrow": ("application/vnd.apache.arrow.stream", ".arrow"),
+}
+
 
 @router.post("/clean/remove-nulls/", response_model=dict)
 async def clean_csv_remove_nulls(
-    file: UploadFile = File(...), remove_duplicates: bool = True
+    file: UploadFile = Depends(validate_csv_upload), remove_duplicates: bool = True
 ):
     """
     Clean a CSV file by removing all rows containing null values and optionally removing duplicate rows
@@ -38,16 +47,16 @@ async def clean_csv_remove_nulls(
         - duplicate_rows_sample: Sample of duplicate rows that were removed (if any)
     """
     try:
-        cleaning_service = CleaningService()
-
         # Process the cleaning request with combined functionality
-        cleaning_result = await cleaning_service.clean_csv_combined(
-            file, remove_duplicates
+        cleaning_result = await run_cpu_bound(
+            cleaning_service.clean_csv_combined, file, remove_duplicates
         )
 
-        logger.info(
-            f"Successfully cleaned CSV file (nulls and duplicates): {file.filename}"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Successfully cleaned CSV file (nulls and duplicates): %s",
+                file.filename,
+            )
         return cleaning_result
 
     except CSVProcessingError as e:
@@ -60,7 +69,9 @@ async def clean_csv_remove_nulls(
 
 @router.post("/clean/remove-nulls/download/")
 async def download_cleaned_csv(
-    file: UploadFile = File(...), remove_duplicates: bool = True
+    file: UploadFile = Depends(validate_csv_upload),
+    remove_duplicates: bool = True,
+    output_format: Literal["csv", "arrow"] = Query("csv", alias="format"),
 ):
     """
     Clean a CSV file by removing all rows containing null values and optionally duplicate rows,
@@ -69,25 +80,29 @@ async def download_cleaned_csv(
     Args:
         file: Uploaded CSV file
         remove_duplicates: Whether to remove duplicate rows (default: True)
+        output_format: "csv" (default), or "arrow" for a typed Arrow IPC stream
 
     Returns:
-        StreamingResponse with the cleaned CSV file for download
+        Response with the cleaned CSV file for download
     """
     try:
-        cleaning_service = CleaningService()
-
-        # Generate cleaned CSV file as bytes using combined approach
-        cleaned_csv_bytes = await cleaning_service.get_combined_cleaned_csv_file(
-            file, remove_duplicates
+        # Clean the file using combined approach; serialization is deferred
+        cleaned_chunks = await run_cpu_bound(
+            cleaning_service.get_combined_cleaned_csv_file,
+            file,
+            remove_duplicates,
+            output_format,
         )
 
-        # Prepare for download
+        media_type, extension = DOWNLOAD_FORMATS[output_format]
+        filename = f"cleaned_{os.path.splitext(file.filename)[0]}{extension}"
+
+        # Stream the file a block of rows at a time, so the whole serialized
+        # file is never held in memory and the first bytes go out early
         return StreamingResponse(
-            io.BytesIO(cleaned_csv_bytes),
-            media_type="text/csv",
-            headers={
-                "Content-Disposition": f"attachment; filename=cleaned_{file.filename}"
-            },
+            iterate_cpu_bound(cleaned_chunks),
+            media_type=media_type,
+            headers={"Content-Disposition": f"attachment; filename={filename}"},
         )
 
     except CSVProcessingError as e:
@@ -99,7 +114,7 @@ async def download_cleaned_csv(
 
 
 @router.post("/removed-rows/", response_model=dict)
-async def get_all_removed_rows(file: UploadFile = File(...)):
+async def get_all_removed_rows(file: UploadFile = Depends(validate_csv_upload)):
     """
     Get all rows that would be removed from a CSV file due to null values
 
@@ -115,18 +130,13 @@ async def get_all_removed_rows(file: UploadFile = File(...)):
         - null_counts_by_column: Dictionary mapping column names to their null counts
     """
     try:
-        # Create the service
-        removed_rows_service = AllRemovedRowsService()
-
-        # Read file content
-        content = await file.read()
-
         # Get all removed rows
-        result = await removed_rows_service.get_all_removed_rows(content)
+        result = await run_cpu_bound(removed_rows_service.get_all_removed_rows, file)
 
-        logger.info(
-            f"Successfully retrieved all removed rows for file: {file.filename}"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Successfully retrieved all removed rows for file: %s", file.filename
+            )
         return result
 
     except CSVProcessingError as e:
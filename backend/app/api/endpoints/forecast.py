@@ -1,24 +1,52 @@
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException
+"""
+Forecast endpoint: accepts CSV upload plus date and outcome columns, returns a SARIMAX forecast.
+"""
+
+import hashlib
+
+from fastapi import APIRouter, UploadFile, Depends, Form, HTTPException
 import pandas as pd
 import numpy as np
-from typing import Optional, List
-import io
+from typing import Optional, List, Tuple
 
+from pandas.tseries.frequencies import to_offset
 from statsmodels.tsa.statespace.sarimax import SARIMAX
 
+from ..deps import validate_csv_upload, parse_exogenous_columns
+from ..responses import ORJSONResponse
+from ...core.concurrency import run_cpu_bound
+from ...core.csv_processor import UploadResultCache, csv_processor
+from ...config import settings
+
 router = APIRouter()
 
+# SARIMAX (p, d, q) order fitted to every series
+SARIMAX_ORDER = (1, 1, 1)
+
+# Forecast arrays by series content, model and horizon, so re-running a
+# forecast on the same data skips the fit. Only the mean and interval arrays
+# are kept: a fitted SARIMAXResults holds the data and every filter state
+# (about 230 MB for a 100k-point series). Cached arrays are shared
+forecast_cache = UploadResultCache(settings.FORECAST_CACHE_SIZE)
+
 
 def _ensure_datetime_index(df: pd.DataFrame, date_col: str) -> pd.DataFrame:
     if date_col not in df.columns:
         raise HTTPException(
             status_code=400, detail=f"date_col '{date_col}' not found in columns"
         )
-    df = df.copy()
-    try:
-        df[date_col] = pd.to_datetime(df[date_col], errors="coerce")
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Failed to parse date column: {e}")
+    # Shallow copy: the date column is replaced, not modified in place
+    df = df.copy(deep=False)
+    # The upload is read with typed_dates, so ISO dates and timestamps are
+    # already datetime64; other text goes through to_datetime, which infers
+    # one format and caches repeated values
+    if not pd.api.types.is_datetime64_any_dtype(df[date_col]):
+        try:
+            df[date_col] = pd.to_datetime(df[date_col], errors="coerce")
+        except Exception as e:
+            raise HTTPException(
+                status_code=400, detail=f"Failed to parse date column: {e}"
+            )
     df = df.dropna(subset=[date_col])
     if df.empty:
         raise HTTPException(
@@ -29,13 +57,19 @@ def _ensure_datetime_index(df: pd.DataFrame, date_col: str) -> pd.DataFrame:
 
 
 def _coerce_numeric(df: pd.DataFrame, cols: List[str]) -> pd.DataFrame:
-    df = df.copy()
+    # Shallow copy: coerced columns are assigned as new arrays
+    df = df.copy(deep=False)
     for c in cols:
         if c not in df.columns:
             raise HTTPException(
                 status_code=400, detail=f"Column '{c}' not found in CSV"
             )
-        df[c] = pd.to_numeric(df[c], errors="coerce")
+    text_cols = [
+        c for c in dict.fromkeys(cols) if not pd.api.types.is_numeric_dtype(df[c])
+    ]
+    parsed = csv_processor.parse_number_columns(df, text_cols)
+    for c, numeric in zip(text_cols, parsed):
+        df[c] = numeric
     # Drop rows where outcome (and exog if present) are NaN
     df = df.dropna(subset=cols)
     if df.empty:
@@ -45,96 +79,173 @@ def _coerce_numeric(df: pd.DataFrame, cols: List[str]) -> pd.DataFrame:
     return df
 
 
-@router.post("/forecast")
-@router.post("/forecast/")
-async def forecast(
-    file: UploadFile = File(...),
-    date_col: str = Form(...),
-    outcome: str = Form(...),
-    treatments: Optional[str] = Form(None),
-    steps: int = Form(12),
-):
-    # Read CSV from upload
-    try:
-        contents = await file.read()
-        try:
-            text = contents.decode("utf-8", errors="ignore")
-            df = pd.read_csv(io.StringIO(text))
-        except Exception:
-            df = pd.read_csv(io.BytesIO(contents))
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Failed to read CSV: {e}")
-
-    # Prepare dataframe
-    df = _ensure_datetime_index(df, date_col)
-
-    exog_cols: List[str] = []
-    if treatments:
-        exog_cols = [c.strip() for c in treatments.split(",") if c.strip()]
-
-    cols_to_numeric = [outcome] + exog_cols
-    df = _coerce_numeric(df, cols_to_numeric)
+def _series_digest(y: pd.Series, exog: Optional[pd.DataFrame]) -> bytes:
+    """Hash of the dates, outcome and exogenous values a model is fitted on"""
+    digest = hashlib.blake2b(digest_size=16)
+    arrays = [y.index.to_numpy(), y.to_numpy()]
+    if exog is not None:
+        arrays.append(exog.to_numpy())
+    for values in arrays:
+        # dtype and shape separate arrays whose raw bytes happen to match
+        digest.update(f"{values.dtype}{values.shape}".encode())
+        digest.update(np.ascontiguousarray(values).tobytes())
+    return digest.digest()
 
-    y = df[outcome].astype(float)
-    exog = df[exog_cols].astype(float) if exog_cols else None
 
-    # Fit SARIMAX
+def _fit_sarimax(y: pd.Series, exog: Optional[pd.DataFrame]):
+    """Fit the forecast model; raises HTTPException if fitting fails."""
     try:
         model = SARIMAX(
             y,
-            order=(1, 1, 1),
+            order=SARIMAX_ORDER,
             exog=exog,
             enforce_stationarity=False,
             enforce_invertibility=False,
         )
-        res = model.fit(disp=False)
+        return model.fit(disp=False)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Model fitting failed: {e}")
 
+
+def _forecast_arrays(
+    y: pd.Series, exog: Optional[pd.DataFrame], steps: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Fit the model and forecast steps ahead: mean, lower and upper bounds."""
+    res = _fit_sarimax(y, exog)
+
     # Prepare future exogenous values by repeating the last observed row
     future_exog = None
-    if exog is not None and len(exog_cols) > 0:
+    if exog is not None:
         last_row = exog.iloc[[-1]].to_numpy()
         future_exog = np.repeat(last_row, repeats=steps, axis=0)
 
     try:
         forecast_res = res.get_forecast(steps=steps, exog=future_exog)
-        fc_mean = forecast_res.predicted_mean
+        fc_mean = forecast_res.predicted_mean.to_numpy()
         conf_int = forecast_res.conf_int(alpha=0.05)
-        lower = conf_int.iloc[:, 0]
-        upper = conf_int.iloc[:, 1]
+        # Both bounds come out of one conversion of the interval frame, as
+        # contiguous rows that orjson can encode directly
+        lower, upper = np.ascontiguousarray(conf_int.to_numpy(dtype=np.float64).T[:2])
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Forecast generation failed: {e}")
+    return fc_mean, lower, upper
 
-    # Dates
-    dates_history = y.index.astype(str).tolist()
-    if y.index.freqstr:
-        future_index = pd.date_range(
-            start=y.index[-1] + y.index.freq, periods=steps, freq=y.index.freq
+
+def _future_index(index: pd.DatetimeIndex, steps) -> pd.DatetimeIndex:
+    """Dates of the forecast steps, continuing the history's spacing."""
+    # Normalize steps
+    try:
+        steps = int(steps)
+    except Exception:
+        steps = 12
+    if steps < 1:
+        steps = 1
+
+    # Use the index frequency, else an inferred calendar frequency (month
+    # starts and the like), else the most common positive spacing
+    if index.freq is not None:
+        return pd.date_range(
+            start=index[-1] + index.freq, periods=steps, freq=index.freq
         )
+
+    inferred = None
+    try:
+        inferred = pd.infer_freq(index)
+    except Exception:
+        inferred = None
+    if inferred:
+        offset = to_offset(inferred)
+        return pd.date_range(start=index[-1] + offset, periods=steps, freq=offset)
+
+    # Spacing from the raw int64 stamps: the index is sorted and free of NaT,
+    # so np.diff needs no Series or null handling. np.unique sorts, so ties go
+    # to the smallest step, as with Series.mode
+    diffs = np.diff(index.asi8)
+    diffs = diffs[diffs > 0]
+    if diffs.size:
+        steps_seen, counts = np.unique(diffs, return_counts=True)
+        delta = pd.Timedelta(int(steps_seen[counts.argmax()]), unit=index.unit)
     else:
-        diffs = y.index.to_series().diff().dropna()
-        median_delta = diffs.median() if not diffs.empty else pd.Timedelta(days=1)
-        future_index = pd.date_range(
-            start=y.index[-1] + median_delta, periods=steps, freq=median_delta
-        )
-    dates_forecast = future_index.astype(str).tolist()
+        delta = pd.Timedelta(days=1)
+    return pd.date_range(start=index[-1] + delta, periods=steps, freq=delta)
+
+
+def _run_forecast(
+    df: pd.DataFrame,
+    date_col: str,
+    outcome: str,
+    exog_cols: List[str],
+    steps: int,
+) -> dict:
+    """Blocking model fit and forecast; runs on the threadpool."""
+    # Only the date, outcome and exogenous columns are used, so the rest are
+    # dropped before the dropna and sort passes below; missing ones are left
+    # for the helpers to report
+    used_cols = dict.fromkeys([date_col, outcome, *exog_cols])
+    df = df[[c for c in used_cols if c in df.columns]]
+
+    # Prepare dataframe
+    df = _ensure_datetime_index(df, date_col)
+
+    cols_to_numeric = [outcome] + exog_cols
+    df = _coerce_numeric(df, cols_to_numeric)
+
+    y = df[outcome].astype(float)
+    exog = df[exog_cols].astype(float) if exog_cols else None
+
+    # Fit and forecast, or reuse the forecast for identical data and horizon;
+    # failures raise and are not cached
+    forecast_key = (
+        _series_digest(y, exog),
+        tuple(exog_cols),
+        SARIMAX_ORDER,
+        steps,
+    )
+    fc_mean, lower, upper = forecast_cache.get_or_compute(
+        forecast_key, lambda: _forecast_arrays(y, exog, steps)
+    )
+
+    # Dates. The response lists are built from whole arrays rather than per
+    # label: astype(str) formats the index in C, about 10x faster than
+    # strftime on 100k timestamps, and keeps date-only indexes as YYYY-MM-DD
+    dates_history = y.index.astype(str).tolist()
+    dates_forecast = _future_index(y.index, steps).astype(str).tolist()
 
+    # Numeric series stay numpy arrays; ORJSONResponse encodes them in C
     return {
-        "history": y.tolist(),
-        "forecast": fc_mean.tolist(),
-        "conf_int_lower": lower.tolist(),
-        "conf_int_upper": upper.tolist(),
+        "history": y.to_numpy(),
+        "forecast": fc_mean,
+        "conf_int_lower": lower,
+        "conf_int_upper": upper,
         "dates_history": dates_history,
         "dates_forecast": dates_forecast,
     }
 
 
-"""
-Deprecated: Forecasting endpoints have been removed.
-This module is intentionally minimal to avoid import errors if referenced.
-"""
-
-from fastapi import APIRouter
+@router.post("/forecast")
+@router.post("/forecast/")
+async def forecast(
+    file: UploadFile = Depends(validate_csv_upload),
+    date_col: str = Form(...),
+    outcome: str = Form(...),
+    exog_cols: List[str] = Depends(parse_exogenous_columns),
+    steps: int = Form(12),
+):
+    # Read CSV from upload
+    try:
+        df = await run_cpu_bound(
+            csv_processor.generate_df_from_upload, file, typed_dates=True
+        )
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Failed to read CSV: {e}")
 
-router = APIRouter()
+    # The fit runs on a worker thread, so the event loop keeps serving other
+    # requests; statsmodels drops the GIL often enough that loop ticks stay
+    # within a few ms during a fit. Threads also share forecast_cache,
+    # which a process pool would not
+    result = await run_cpu_bound(
+        _run_forecast, df, date_col, outcome, exog_cols, steps
+    )
+    # Returned as a response so FastAPI skips jsonable_encoder, which walks
+    # every value in Python (0.2s for a 100k-point history)
+    return ORJSONResponse(result)
@@ -2,22 +2,26 @@
 Health check endpoints
 """
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 
 from ...models.responses import HealthResponse
 from ...config import settings
 
 router = APIRouter()
 
+# The health payload never changes, so it is serialized once at import
+_HEALTH_BODY = HealthResponse(
+    status="healthy",
+    message="CSV AI Workflow Automator is running",
+    version=settings.VERSION,
+).model_dump_json().encode("utf-8")
 
-@router.get("/health", response_model=HealthResponse)
+
+@router.get("/health", responses={200: {"model": HealthResponse}})
+@router.head("/health", include_in_schema=False)
 async def health_check():
-    """Health check endpoint"""
-    return HealthResponse(
-        status="healthy",
-        message="CSV AI Workflow Automator is running",
-        version=settings.VERSION,
-    )
+    """Health check endpoint; returns prebuilt bytes without per-request validation"""
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @router.get("/", response_model=dict)
@@ -0,0 +1,22 @@
+"""
+Response classes shared by the API routers
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson
+
+    orjson encodes floats, ints and numpy arrays in C, which keeps large
+    preview, forecast and graph payloads cheap to serialize.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
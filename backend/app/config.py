@@ -33,6 +33,12 @@ class Settings:
     # Data Processing Settings
     MAX_PREVIEW_ROWS: int = 100
     DEFAULT_PREVIEW_ROWS: int = 5
+    PARSED_CSV_CACHE_SIZE: int = int(os.getenv("PARSED_CSV_CACHE_SIZE", "8"))  # uploads
+    CLEANED_CSV_CACHE_SIZE: int = int(os.getenv("CLEANED_CSV_CACHE_SIZE", "4"))  # uploads
+    PARSED_CSV_CACHE_MAX_MB: int = int(os.getenv("PARSED_CSV_CACHE_MAX_MB", "512"))
+    CLEANED_CSV_CACHE_MAX_MB: int = int(os.getenv("CLEANED_CSV_CACHE_MAX_MB", "512"))
+    FORECAST_CACHE_SIZE: int = int(os.getenv("FORECAST_CACHE_SIZE", "64"))  # forecasts
+    COLUMN_STATS_CACHE_SIZE: int = int(os.getenv("COLUMN_STATS_CACHE_SIZE", "128"))  # columns
 
     # Agent Settings
     AGENT_MAX_ITERATIONS: int = 12
@@ -0,0 +1,58 @@
+"""
+Worker-thread offloading for CPU-bound request work
+"""
+
+import os
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Iterator, TypeVar
+
+import anyio.to_thread
+
+T = TypeVar("T")
+
+# CSV parsing, cleaning and model fitting run on at most one worker thread per
+# core. Starlette's shared threadpool admits 40, which would oversubscribe the
+# CPU and hold that many parsed frames in memory at once
+cpu_limiter = anyio.CapacityLimiter(os.cpu_count() or 1)
+
+
+async def run_cpu_bound(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking, CPU-bound call on a worker thread and await its result
+
+    The event loop keeps serving other requests meanwhile. PyArrow, pandas
+    and numpy release the GIL in their kernels, so concurrent uploads are
+    processed in parallel.
+
+    Args:
+        func: Synchronous callable to run
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        Whatever func returns; exceptions it raises propagate to the caller
+    """
+    return await anyio.to_thread.run_sync(
+        partial(func, *args, **kwargs), limiter=cpu_limiter
+    )
+
+
+async def iterate_cpu_bound(iterator: Iterator[T]) -> AsyncIterator[T]:
+    """
+    Drain a blocking iterator on worker threads, one item per call
+
+    Each item is produced under cpu_limiter like any other run_cpu_bound call,
+    so a long download cannot hold a worker slot between chunks.
+
+    Args:
+        iterator: Synchronous iterator whose items are costly to produce
+
+    Yields:
+        The iterator's items, in order
+    """
+    exhausted = object()
+    while True:
+        item = await run_cpu_bound(next, iterator, exhausted)
+        if item is exhausted:
+            return
+        yield item
@@ -4,24 +4,210 @@ CSV processing and analysis utilities
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+from pandas._libs.parsers import STR_NA_VALUES
 import csv
-from typing import Dict, List, Any, Tuple, Optional
-from io import StringIO, BytesIO
+import hashlib
+import io
+import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 import logging
 
+from ..config import settings
+
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# PyArrow CSV reader settings: multithreaded parsing in 8MB blocks, and empty
+# or NA-like cells in string columns become nulls, matching pandas.read_csv.
+# Arrow's own null tokens lack pandas' "None" and "<NA>", so pandas' list is
+# passed explicitly.
+# The writer emits rows only, unquoted; df_to_csv_bytes writes the header itself
+ARROW_NULL_VALUES = sorted(STR_NA_VALUES)
+ARROW_READ_OPTIONS = pacsv.ReadOptions(use_threads=True, block_size=8 << 20)
+ARROW_CONVERT_OPTIONS = pacsv.ConvertOptions(
+    null_values=ARROW_NULL_VALUES, strings_can_be_null=True
+)
+ARROW_WRITE_OPTIONS = pacsv.WriteOptions(include_header=False, quoting_style="none")
+
+# Number formatting rewritten before numeric conversion: thousands separators,
+# currency and percent signs are dropped, and the Unicode minus becomes "-"
+NUMBER_FORMAT_REPLACEMENTS = ((",", ""), ("$", ""), ("%", ""), ("−", "-"))
+
+# Arrow-backed string dtype with NaN as the missing value (the pandas 3 default
+# "str" dtype); older pandas without it keeps strings as object columns
+try:
+    ARROW_STRING_DTYPE = pd.StringDtype("pyarrow", na_value=np.nan)
+except TypeError:
+    ARROW_STRING_DTYPE = None
+
+# Column-name fragments (IDs, zip codes, phone numbers...) that stay text even
+# when their values look numeric
+NUMERIC_EXCLUDE_PATTERNS = [
+    "id",
+    "code",
+    "phone",
+    "zip",
+    "postal",
+    "year",
+    "ssn",
+    "identifier",
+    "password",
+]
+NUMERIC_EXCLUDE_RE = re.compile("|".join(map(re.escape, NUMERIC_EXCLUDE_PATTERNS)))
+
+# Non-null values sampled to estimate whether a text column is numeric
+NUMERIC_PROBE_SIZE = 1000
+
+# Strings that parse to an integer column rather than float
+INTEGER_LITERAL_PATTERN = r"^-?[0-9]+$"
+
+# Text columns whose leading values repeat at least this many times on average
+# are parsed once per distinct value instead of once per row
+REPEATED_VALUES_FACTOR = 4
+
+# Rows serialized per chunk when a cleaned file is streamed to the client
+DOWNLOAD_CHUNK_ROWS = 100_000
+
+# Cells to_csv formats per pass of its writer. Each pass holds the GIL, so
+# smaller passes let the event loop run while a worker thread writes a file
+TO_CSV_GIL_CELLS = 10_000
+
+# Rows scanned for column sample values before falling back to the full column
+SAMPLE_SCAN_ROWS = 50
+
+# Null rows materialized as records by identify_null_rows unless told otherwise
+NULL_ROW_SAMPLE_LIMIT = 100
+
+# Bytes read per step when hashing an upload for the parsed-table cache
+UPLOAD_HASH_CHUNK_SIZE = 1 << 20
+
+
+@dataclass
+class NullStats:
+    """Null counts per column and the row null mask from one scan of a DataFrame"""
+
+    columns: List[Any]
+    column_counts: np.ndarray
+    row_mask: np.ndarray
+
+    @property
+    def counts_by_column(self) -> Dict[Any, int]:
+        return dict(zip(self.columns, self.column_counts.tolist()))
+
+    @property
+    def rows_with_nulls(self) -> int:
+        return int(np.count_nonzero(self.row_mask))
+
+
+@dataclass
+class ColumnStats:
+    """Null and distinct counts and sample values per column of a parsed Arrow table"""
+
+    null_counts: np.ndarray
+    unique_counts: np.ndarray
+    sample_values: List[List[str]]
+
+
+class UploadResultCache:
+    """
+    Thread-safe LRU of results computed from an upload, keyed by its content hash
+
+    Analyze, clean and causal requests for the same file parse it once; Arrow
+    tables are immutable, so every caller can share the cached one. Other
+    cached values are shared the same way and must not be modified.
+
+    Besides the entry count, the cache can be bounded by the total size of its
+    values as measured by sizeof; a value larger than the bound on its own is
+    returned without being cached.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        max_bytes: Optional[int] = None,
+        sizeof: Optional[Callable[[Any], int]] = None,
+    ):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._values: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """
+        Return the value cached under key, computing it with compute on a miss
+
+        Args:
+            key: Content hash of the upload, optionally combined with options
+            compute: Zero-argument callable that computes the value
+
+        Returns:
+            Cached or freshly computed value
+        """
+        with self._lock:
+            value = self._values.get(key)
+            if value is not None:
+                self._values.move_to_end(key)
+                return value
+
+        # Compute outside the lock so different uploads don't queue behind it
+        value = compute()
+        size = self._sizeof(value) if self._sizeof is not None else 0
+        if self.maxsize > 0 and (self.max_bytes is None or size <= self.max_bytes):
+            with self._lock:
+                self._total_bytes += size - self._sizes.get(key, 0)
+                self._values[key] = value
+                self._sizes[key] = size
+                self._values.move_to_end(key)
+                while len(self._values) > self.maxsize or (
+                    self.max_bytes is not None and self._total_bytes > self.max_bytes
+                ):
+                    evicted, _ = self._values.popitem(last=False)
+                    self._total_bytes -= self._sizes.pop(evicted)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+            self._sizes.clear()
+            self._total_bytes = 0
+
 
 class CSVProcessor:
     """Handle CSV file processing and analysis"""
 
     @staticmethod
-    def generate_df_from_csv(file_content: bytes) -> pd.DataFrame:
+    def generate_df_from_csv(file_content: Union[bytes, Any]) -> pd.DataFrame:
         """
         Process uploaded CSV file content into a pandas DataFrame
 
+        The bytes are handed to PyArrow's multithreaded reader directly, so no
+        decoded Python string or StringIO copy is built.
+
         Args:
-            file_content: Raw bytes of the CSV file
+            file_content: Raw bytes of the CSV file, or a binary file-like object
 
         Returns:
             pandas.DataFrame: Processed CSV data
@@ -29,56 +215,496 @@ class CSVProcessor:
         Raises:
             ValueError: If file cannot be processed as CSV
         """
-        try:
-            # Decode bytes to string
-            csv_string = file_content.decode("utf-8")
+        table = CSVProcessor._read_csv_table(CSVProcessor._arrow_source(file_content))
+        return CSVProcessor.table_to_df(table, self_destruct=True)
 
-            # Create DataFrame from CSV string
-            df = pd.read_csv(StringIO(csv_string))
+    @staticmethod
+    def _arrow_source(file_content: Union[bytes, Any]) -> Any:
+        """Wrap raw bytes for PyArrow; file-like objects are passed through"""
+        if isinstance(file_content, (bytes, bytearray, memoryview)):
+            return pa.BufferReader(file_content)
+        return file_content
 
-            logger.info(f"Successfully processed CSV with shape: {df.shape}")
-            return df
+    @staticmethod
+    def generate_table_from_upload(
+        upload_file: Any, digest: Optional[bytes] = None, typed_dates: bool = False
+    ) -> pa.Table:
+        """
+        Parse an uploaded CSV file into an Arrow table without converting to pandas
 
-        except UnicodeDecodeError as e:
-            logger.error(f"Failed to decode CSV file: {e}")
-            raise ValueError(
-                "File encoding not supported. Please use UTF-8 encoded CSV files."
+        Tables are cached by a hash of the file's content, so repeated requests
+        for the same upload skip parsing. The returned table is shared and must
+        not be converted with self_destruct.
+
+        Args:
+            upload_file: FastAPI UploadFile whose underlying file object is read
+            digest: upload_digest(upload_file), when the caller already has it
+            typed_dates: Keep the date, time and timestamp types Arrow infers
+                instead of the columns' original text
+
+        Returns:
+            pyarrow.Table: Parsed CSV data
+
+        Raises:
+            ValueError: If file cannot be processed as CSV
+        """
+        source = upload_file.file
+
+        def parse() -> pa.Table:
+            source.seek(0)
+            return CSVProcessor._read_csv_table(source, typed_dates)
+
+        if digest is None:
+            digest = CSVProcessor.upload_digest(upload_file)
+        return parsed_table_cache.get_or_compute((digest, typed_dates), parse)
+
+    @staticmethod
+    def upload_digest(upload_file: Any) -> bytes:
+        """Hash an upload's full content, leaving its file at offset 0"""
+        source = upload_file.file
+        digest = hashlib.blake2b(digest_size=16)
+        source.seek(0)
+        for chunk in iter(lambda: source.read(UPLOAD_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+        source.seek(0)
+        return digest.digest()
+
+    @staticmethod
+    def generate_df_from_upload(
+        upload_file: Any, typed_dates: bool = False
+    ) -> pd.DataFrame:
+        """
+        Parse an uploaded CSV file straight from its spooled file handle with PyArrow,
+        without first buffering the whole upload into a bytes object
+
+        Args:
+            upload_file: FastAPI UploadFile whose underlying file object is read
+            typed_dates: Return ISO date and timestamp columns as datetime64
+                instead of the columns' original text
+
+        Returns:
+            pandas.DataFrame: Processed CSV data
+
+        Raises:
+            ValueError: If file cannot be processed as CSV
+        """
+        table = CSVProcessor.generate_table_from_upload(
+            upload_file, typed_dates=typed_dates
+        )
+        return CSVProcessor.table_to_df(table)
+
+    @staticmethod
+    def _read_csv_table(source: Any, typed_dates: bool = False) -> pa.Table:
+        """
+        Read CSV from a seekable file-like source with PyArrow, mapping errors to
+        ValueError
+
+        Unless typed_dates is set, columns Arrow infers as dates, times or
+        timestamps are read again as text, as pandas.read_csv keeps them:
+        converting back would not reproduce the file ("10:30" reads as a
+        time and prints as "10:30:00"), and cleaned downloads must. Column
+        names are made unique the way pandas does it.
+        """
+        try:
+            table = pacsv.read_csv(
+                source,
+                read_options=ARROW_READ_OPTIONS,
+                convert_options=ARROW_CONVERT_OPTIONS,
+            )
+            table = CSVProcessor._restore_text_columns(table, source, typed_dates)
+            return table.rename_columns(
+                CSVProcessor._pandas_column_names(table.column_names)
             )
-        except pd.errors.EmptyDataError as e:
-            logger.error(f"Empty CSV file: {e}")
-            raise ValueError("The CSV file appears to be empty.")
-        except pd.errors.ParserError as e:
+        except pa.ArrowInvalid as e:
             logger.error(f"CSV parsing error: {e}")
+            if "Empty CSV file" in str(e):
+                raise ValueError("The CSV file appears to be empty.")
             raise ValueError("Invalid CSV format. Please check your file structure.")
         except Exception as e:
             logger.error(f"Unexpected error processing CSV: {e}")
             raise ValueError(f"Failed to process CSV file: {str(e)}")
 
     @staticmethod
-    def get_column_info(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    def _restore_text_columns(
+        table: pa.Table, source: Any, typed_dates: bool
+    ) -> pa.Table:
+        """
+        Re-read the columns Arrow types differently from pandas.read_csv
+
+        Dates, times and timestamps (unless typed_dates) go back to their
+        text. Null-free float columns holding integers past the int64 range
+        become uint64 when their text parses as such, as pandas reads them.
+        """
+        temporal = []
+        if not typed_dates:
+            temporal = [
+                i
+                for i, field in enumerate(table.schema)
+                if pa.types.is_temporal(field.type)
+            ]
+        large_ints = []
+        for i, column in enumerate(table.columns):
+            if (
+                pa.types.is_float64(column.type)
+                and column.null_count == 0
+                and len(column) > 0
+            ):
+                bounds = pc.min_max(column).as_py()
+                if bounds["min"] >= 0 and bounds["max"] >= 2.0**63:
+                    large_ints.append(i)
+        if not temporal and not large_ints:
+            return table
+
+        text = CSVProcessor._reread_as_text(table, source, temporal + large_ints)
+        for i in temporal:
+            table = table.set_column(i, table.field(i).name, text[i])
+        for i in large_ints:
+            try:
+                values = pc.cast(text[i], pa.uint64())
+            except pa.ArrowInvalid:
+                # Not plain integer literals (e.g. 1e19); pandas keeps floats
+                continue
+            table = table.set_column(i, table.field(i).name, values)
+        return table
+
+    @staticmethod
+    def _reread_as_text(
+        table: pa.Table, source: Any, positions: List[int]
+    ) -> Dict[int, pa.ChunkedArray]:
+        """Read the columns at positions again as strings, keyed by position"""
+        names = [table.field(i).name for i in positions]
+        # Only those columns are converted on the second read; a duplicated
+        # header name needs the full read, since include_columns would pick
+        # only its first column
+        duplicated = len(set(table.column_names)) < table.num_columns
+        source.seek(0)
+        text = pacsv.read_csv(
+            source,
+            read_options=ARROW_READ_OPTIONS,
+            convert_options=pacsv.ConvertOptions(
+                null_values=ARROW_NULL_VALUES,
+                strings_can_be_null=True,
+                column_types={name: pa.string() for name in names},
+                include_columns=None if duplicated else names,
+            ),
+        )
+        if duplicated:
+            return {i: text.column(i) for i in positions}
+        return {i: text.column(name) for i, name in zip(positions, names)}
+
+    @staticmethod
+    def _pandas_column_names(names: List[str]) -> List[str]:
+        """
+        Column names as pandas.read_csv gives them: blank names become
+        "Unnamed: {position}" and repeats get ".1", ".2"... suffixes
+
+        Arrow keeps the header as written. As in pandas' C parser, named
+        columns are de-duplicated before blank ones, and a suffix already
+        used by another header cell is skipped.
+        """
+        header = [name if name else f"Unnamed: {i}" for i, name in enumerate(names)]
+        in_header = set(header)
+        if len(in_header) == len(header) and all(names):
+            return header
+
+        counts: Dict[str, int] = {}
+        result = list(header)
+        order = [i for i, name in enumerate(names) if name] + [
+            i for i, name in enumerate(names) if not name
+        ]
+        for i in order:
+            col = original = header[i]
+            count = counts.get(col, 0)
+            while count > 0:
+                counts[original] = count + 1
+                col = f"{original}.{count}"
+                count = count + 1 if col in in_header else counts.get(col, 0)
+            result[i] = col
+            counts[col] = count + 1
+        return result
+
+    @staticmethod
+    def table_to_df(table: pa.Table, self_destruct: bool = False) -> pd.DataFrame:
+        """
+        Convert a parsed Arrow table to pandas, rejecting non-UTF-8 content
+
+        With self_destruct the table's buffers are released as they are
+        converted, lowering peak memory; only pass it for a table nobody else
+        holds, since the table is unusable afterwards.
+        """
+        # Arrow keeps columns that are not valid UTF-8 as raw binary
+        if any(pa.types.is_binary(field.type) for field in table.schema):
+            logger.error("Failed to decode CSV file: non UTF-8 column data")
+            raise ValueError(
+                "File encoding not supported. Please use UTF-8 encoded CSV files."
+            )
+
+        # Keep string columns in Arrow memory so nunique/isna run as Arrow
+        # compute kernels instead of hashing Python str objects
+        types_mapper = None
+        if ARROW_STRING_DTYPE is not None:
+            types_mapper = {
+                pa.string(): ARROW_STRING_DTYPE,
+                pa.large_string(): ARROW_STRING_DTYPE,
+            }.get
+        # Date columns (only left by typed_dates reads) become datetime64
+        # rather than object columns of datetime.date
+        df = table.to_pandas(
+            split_blocks=True,
+            self_destruct=self_destruct,
+            types_mapper=types_mapper,
+            date_as_object=False,
+        )
+        logger.info("Successfully processed CSV with shape: %s", df.shape)
+        return df
+
+    @staticmethod
+    def table_column_stats(table: pa.Table) -> ColumnStats:
+        """
+        Null and distinct counts and sample values for every column of an Arrow table
+
+        Null counts are kept in each Arrow array's metadata, distinct values
+        come from Arrow's hash kernel and samples from a head slice, so no
+        pandas objects are touched.
+
+        Args:
+            table: Parsed CSV table
+
+        Returns:
+            ColumnStats aligned with the table's columns
+        """
+        null_counts = np.array(
+            [column.null_count for column in table.columns], dtype=np.int64
+        )
+        # unique() keeps null as one value; it is cheaper per column than
+        # count_distinct, which pays a kernel dispatch per chunk
+        unique_counts = np.array(
+            [
+                len(column.unique()) - (column.null_count > 0)
+                for column in table.columns
+            ],
+            dtype=np.int64,
+        )
+        # Samples are rendered as pandas would show them after table_to_df:
+        # integer columns holding nulls become float64 there, so "1" is "1.0"
+        head = table.slice(0, SAMPLE_SCAN_ROWS)
+        sample_values = []
+        for column, head_column in zip(table.columns, head.columns):
+            values = head_column.drop_null()[:3]
+            if len(values) < 3 and table.num_rows > SAMPLE_SCAN_ROWS:
+                values = column.drop_null()[:3]
+            if pa.types.is_integer(column.type) and column.null_count:
+                values = values.cast(pa.float64())
+            sample_values.append([str(v) for v in values.to_pylist()])
+        return ColumnStats(
+            null_counts=null_counts,
+            unique_counts=unique_counts,
+            sample_values=sample_values,
+        )
+
+    @staticmethod
+    def _unique_counts(df: pd.DataFrame) -> np.ndarray:
+        """
+        Distinct non-null values per column
+
+        Frames holding a single int or float dtype are counted with one
+        column-wise np.sort over the 2D block instead of hashing each column.
+        """
+        dtypes = set(df.dtypes)
+        if df.shape[0] > 0 and len(dtypes) == 1:
+            dtype = dtypes.pop()
+            if isinstance(dtype, np.dtype) and dtype.kind in "iuf":
+                values = np.sort(df.to_numpy(), axis=0)
+                # NaN sorts last, so masking it drops both NaN-NaN and
+                # number-NaN steps from the change count
+                if dtype.kind == "f":
+                    valid = ~np.isnan(values)
+                else:
+                    valid = np.ones_like(values, dtype=bool)
+                changes = (values[1:] != values[:-1]) & valid[1:]
+                return changes.sum(axis=0) + valid.any(axis=0)
+        return df.nunique().to_numpy()
+
+    @staticmethod
+    def get_column_info(
+        df: pd.DataFrame,
+        null_stats: Optional[NullStats] = None,
+        column_stats: Optional[ColumnStats] = None,
+    ) -> List[Dict[str, Any]]:
         """
         Extract detailed information about each column
 
         Args:
             df: pandas DataFrame
+            null_stats: Optional result of compute_null_stats(df) to reuse its
+                per-column null counts
+            column_stats: Optional result of table_column_stats for the table df
+                was converted from; supplies null and distinct counts and samples
 
         Returns:
             List of dictionaries containing column information
         """
-        columns_info = []
+        dtypes = [str(dtype) for dtype in df.dtypes]
+
+        # Everything but the dtype was already read off the Arrow table
+        if column_stats is not None:
+            return [
+                {
+                    "name": col,
+                    "data_type": dtypes[i],
+                    "null_count": int(column_stats.null_counts[i]),
+                    "unique_count": int(column_stats.unique_counts[i]),
+                    "sample_values": column_stats.sample_values[i],
+                }
+                for i, col in enumerate(df.columns)
+            ]
 
-        for col in df.columns:
-            col_info = {
-                "name": col,
-                "data_type": str(df[col].dtype),
-                "null_count": int(df[col].isnull().sum()),
-                "unique_count": int(df[col].nunique()),
-                "sample_values": df[col].dropna().astype(str).head(3).tolist(),
-            }
-            columns_info.append(col_info)
+        # Whole-frame passes instead of several pandas calls per column
+        if null_stats is not None:
+            null_counts = null_stats.column_counts
+        else:
+            null_counts = CSVProcessor._column_null_counts(df)
+        unique_counts = CSVProcessor._unique_counts(df)
+
+        # Samples come from a small head slice; only columns with too few
+        # non-null values there fall back to scanning the full column
+        head = df.head(SAMPLE_SCAN_ROWS)
+        scan_full = len(df) > SAMPLE_SCAN_ROWS
+
+        # Bool, int, float64 and string cells stringify identically with str(),
+        # so those columns are sampled from one 2D object array and null mask
+        # instead of a per-column pandas chain
+        plain = [
+            isinstance(dtype, pd.StringDtype)
+            or (
+                isinstance(dtype, np.dtype)
+                and (dtype.kind in "biu" or dtype == np.float64)
+            )
+            for dtype in df.dtypes
+        ]
+        if any(plain):
+            head_values = head.to_numpy(dtype=object)
+            head_not_null = head.notna().to_numpy()
+
+        columns_info = []
+        for i, col in enumerate(df.columns):
+            if plain[i]:
+                samples = [str(v) for v in head_values[head_not_null[:, i], i][:3]]
+            else:
+                samples = head.iloc[:, i].dropna().head(3).astype(str).tolist()
+            if len(samples) < 3 and scan_full:
+                samples = df.iloc[:, i].dropna().head(3).astype(str).tolist()
+            columns_info.append(
+                {
+                    "name": col,
+                    "data_type": dtypes[i],
+                    "null_count": int(null_counts[i]),
+                    "unique_count": int(unique_counts[i]),
+                    "sample_values": samples,
+                }
+            )
 
         return columns_info
 
+    @staticmethod
+    def df_to_csv_bytes(df: pd.DataFrame) -> bytes:
+        """
+        Serialize a DataFrame to UTF-8 CSV bytes without the index
+
+        Args:
+            df: pandas DataFrame to serialize
+
+        Returns:
+            bytes: CSV file content
+        """
+        return b"".join(CSVProcessor.iter_csv_chunks(df))
+
+    @staticmethod
+    def iter_csv_chunks(
+        df: pd.DataFrame, chunk_rows: int = DOWNLOAD_CHUNK_ROWS
+    ) -> Iterator[bytes]:
+        """
+        Serialize a DataFrame to UTF-8 CSV without the index, a block of rows at a
+        time, so a download can be sent without holding the whole file in memory
+
+        The chunks join to exactly what df.to_csv(index=False) produces.
+
+        Args:
+            df: pandas DataFrame to serialize
+            chunk_rows: Rows serialized per chunk
+
+        Yields:
+            bytes: The header line, then the CSV text of each block of rows
+        """
+        header = io.StringIO()
+        csv.writer(header, lineterminator="\n").writerow(df.columns)
+        yield header.getvalue().encode("utf-8")
+
+        # Arrow's multithreaded writer is an order of magnitude faster than
+        # to_csv, but renders floats, booleans and timestamps differently
+        # (1.0 becomes 1), so it only takes frames of integer and string columns.
+        # Pre-formatting floats the way to_csv does (numpy astype(str)) costs
+        # as much as to_csv itself, so float frames are left to pandas
+        use_arrow = df.columns.is_unique and all(
+            pd.api.types.is_integer_dtype(dtype) or isinstance(dtype, pd.StringDtype)
+            for dtype in df.dtypes
+        )
+        for start in range(0, len(df), chunk_rows):
+            chunk = df.iloc[start : start + chunk_rows]
+            if use_arrow:
+                # Arrow quotes every string, where to_csv quotes only values
+                # that need it; write values unquoted and fall back to to_csv
+                # from the first block holding a quote, comma or newline
+                sink = pa.BufferOutputStream()
+                try:
+                    pacsv.write_csv(
+                        pa.Table.from_pandas(chunk, preserve_index=False),
+                        sink,
+                        write_options=ARROW_WRITE_OPTIONS,
+                    )
+                except pa.ArrowInvalid:
+                    use_arrow = False
+                else:
+                    yield sink.getvalue().to_pybytes()
+                    continue
+            yield chunk.to_csv(
+                index=False,
+                header=False,
+                chunksize=max(1, TO_CSV_GIL_CELLS // max(1, len(df.columns))),
+            ).encode("utf-8")
+
+    @staticmethod
+    def iter_arrow_ipc_chunks(
+        df: pd.DataFrame, chunk_rows: int = DOWNLOAD_CHUNK_ROWS
+    ) -> Iterator[bytes]:
+        """
+        Serialize a DataFrame to an Arrow IPC stream without the index, one
+        record batch at a time
+
+        Unlike CSV the stream keeps column types, and readers can map it
+        without parsing.
+
+        Args:
+            df: pandas DataFrame to serialize
+            chunk_rows: Maximum rows per record batch
+
+        Yields:
+            bytes: Consecutive pieces of the IPC stream; joined they form a
+            complete stream
+        """
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        # The writer appends to an in-memory buffer that is drained after
+        # every batch, so only one batch is serialized at a time
+        buffer = io.BytesIO()
+        with pa.ipc.new_stream(buffer, table.schema) as writer:
+            for batch in table.to_batches(max_chunksize=chunk_rows):
+                writer.write_batch(batch)
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        # Closing the writer appends the end-of-stream marker
+        yield buffer.getvalue()
+
     @staticmethod
     def get_preview_data(df: pd.DataFrame, num_rows: int = 5) -> List[Dict[str, Any]]:
         """
@@ -94,15 +720,20 @@ class CSVProcessor:
         # Ensure we don't request more rows than available
         num_rows = min(num_rows, len(df))
 
-        # Convert to records and handle NaN values
-        preview_data = df.head(num_rows).fillna("").to_dict(orient="records")
-
-        # Convert all values to strings for consistent JSON serialization
-        for row in preview_data:
-            for key, value in row.items():
-                row[key] = str(value) if pd.notna(value) else ""
-
-        return preview_data
+        # Pull the preview rows out as one object array and stringify each cell
+        # once, blanking missing values; fillna + astype(str) would build an
+        # intermediate frame per dtype block, which dominates on wide frames.
+        # Only the head slice is touched, so the cost is independent of the
+        # frame's length; per-column tolist() is slower still, as every column
+        # pays Series overhead (3-7x on 1000 columns)
+        head = df.head(num_rows)
+        columns = head.columns.tolist()
+        values = head.to_numpy(dtype=object)
+        missing = pd.isna(values)
+        return [
+            dict(zip(columns, ["" if m else str(v) for v, m in zip(row, row_missing)]))
+            for row, row_missing in zip(values.tolist(), missing.tolist())
+        ]
 
     @staticmethod
     def validate_columns_exist(
@@ -122,47 +753,132 @@ class CSVProcessor:
         return len(missing_columns) == 0, missing_columns
 
     @staticmethod
-    def remove_null_rows(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    def row_null_mask(df: pd.DataFrame) -> np.ndarray:
+        """
+        Flag rows that contain at least one null value
+
+        Column null masks are OR-ed into a single row-length buffer, so the full
+        rows x columns boolean matrix is never built. The scan stops early once
+        every row is flagged.
+
+        Args:
+            df: pandas DataFrame to check
+
+        Returns:
+            Boolean numpy array, True for each row containing a null
+        """
+        null_mask = np.zeros(len(df), dtype=bool)
+        for _, series in df.items():
+            column_mask = CSVProcessor._column_null_mask(series)
+            if column_mask is None:
+                continue
+            np.logical_or(null_mask, column_mask, out=null_mask)
+            if null_mask.all():
+                break
+        return null_mask
+
+    @staticmethod
+    def _column_null_mask(series: pd.Series) -> Optional[np.ndarray]:
+        """Null mask of one column, or None when its dtype cannot hold nulls"""
+        dtype = series.dtype
+        if isinstance(dtype, np.dtype):
+            if dtype.kind in "biu":
+                return None
+            if dtype.kind == "f":
+                return np.isnan(series.to_numpy())
+        return series.isna().to_numpy()
+
+    @staticmethod
+    def _column_null_counts(df: pd.DataFrame) -> np.ndarray:
+        """Null count per column without building a rows x columns bool frame"""
+        counts = np.zeros(df.shape[1], dtype=np.int64)
+        for i, (_, series) in enumerate(df.items()):
+            column_mask = CSVProcessor._column_null_mask(series)
+            if column_mask is not None:
+                counts[i] = np.count_nonzero(column_mask)
+        return counts
+
+    @staticmethod
+    def compute_null_stats(df: pd.DataFrame) -> NullStats:
+        """
+        Scan a DataFrame for nulls once, column by column
+
+        The result can be passed to get_column_info, remove_null_rows and
+        identify_null_rows so a frame used by several of them is scanned once.
+
+        Args:
+            df: pandas DataFrame to scan
+
+        Returns:
+            NullStats with per-column null counts and the row null mask
+        """
+        null_mask = np.zeros(len(df), dtype=bool)
+        counts = np.zeros(df.shape[1], dtype=np.int64)
+        for i, (_, series) in enumerate(df.items()):
+            column_mask = CSVProcessor._column_null_mask(series)
+            if column_mask is None:
+                continue
+            counts[i] = np.count_nonzero(column_mask)
+            if counts[i]:
+                np.logical_or(null_mask, column_mask, out=null_mask)
+        return NullStats(
+            columns=df.columns.tolist(), column_counts=counts, row_mask=null_mask
+        )
+
+    @staticmethod
+    def _rows_to_records(rows: pd.DataFrame) -> List[Dict[str, Any]]:
+        """
+        Convert selected rows to [{"row_index", "data"}] records in one pass
+
+        Nulls become None for JSON serialization.
+        """
+        rows = rows.astype(object).where(rows.notna(), None)
+        records = rows.to_dict(orient="records")
+        return [
+            {"row_index": int(idx), "data": data}
+            for idx, data in zip(rows.index, records)
+        ]
+
+    @staticmethod
+    def remove_null_rows(
+        df: pd.DataFrame, null_stats: Optional[NullStats] = None
+    ) -> Tuple[pd.DataFrame, Dict[str, Any]]:
         """
         Remove rows containing any null values from the DataFrame
 
         Args:
             df: pandas DataFrame to clean
+            null_stats: Optional result of compute_null_stats(df). Avoids
+                rescanning the frame when the caller already has it.
 
         Returns:
             Tuple of (cleaned_df, cleaning_stats)
             - cleaned_df: DataFrame with null rows removed
             - cleaning_stats: Statistics about the cleaning operation
         """
-        # Make a copy to avoid modifying the original
-        df_cleaned = df.copy()
-
         # Get original shape
-        rows_before = len(df_cleaned)
-
-        # Track which columns had null values and which rows were removed
-        null_counts = df_cleaned.isnull().sum()
-        columns_with_nulls = null_counts[null_counts > 0].index.tolist()
-
-        # Get row indices with null values before dropping
-        rows_with_nulls = df_cleaned[df_cleaned.isnull().any(axis=1)].index.tolist()
-
-        # Get all rows with nulls for display (full data and a sample)
-        sample_rows_with_nulls = []
-        if rows_with_nulls:
-            # Take all rows for the complete dataset
-            for idx in rows_with_nulls:
-                row_data = df_cleaned.loc[idx].to_dict()
-                # Mark null values in the sample
-                for col, val in row_data.items():
-                    if pd.isna(val):
-                        row_data[col] = (
-                            None  # Explicitly set to None for JSON serialization
-                        )
-                sample_rows_with_nulls.append({"row_index": int(idx), "data": row_data})
-
-        # Drop rows with any NA values
-        df_cleaned = df_cleaned.dropna()
+        rows_before = len(df)
+
+        # Track which columns had null values and which rows will be removed
+        if null_stats is None:
+            null_stats = CSVProcessor.compute_null_stats(df)
+        null_counts, null_mask = null_stats.counts_by_column, null_stats.row_mask
+        columns_with_nulls = [col for col, count in null_counts.items() if count > 0]
+        null_positions = np.flatnonzero(null_mask)
+
+        if null_positions.size:
+            # Get all rows with nulls for display (full data and a sample)
+            sample_rows_with_nulls = CSVProcessor._rows_to_records(
+                df.iloc[null_positions]
+            )
+
+            # Drop rows with any NA values; slicing returns a new frame, so the
+            # caller's DataFrame is never modified and no upfront copy is needed
+            df_cleaned = df.loc[~null_mask]
+        else:
+            # Already clean: hand the frame back without a row take
+            sample_rows_with_nulls = []
+            df_cleaned = df
 
         # Calculate cleaning stats
         rows_after = len(df_cleaned)
@@ -179,15 +895,208 @@ class CSVProcessor:
             "removal_percentage": round(removal_percentage, 2),
             "columns_count": len(df_cleaned.columns),
             "columns_with_nulls": columns_with_nulls,
-            "null_counts_by_column": null_counts.to_dict(),
+            "null_counts_by_column": null_counts,
             "sample_removed_rows": sample_rows_with_nulls,
         }
 
         logger.info(
-            f"Removed {rows_removed} rows containing null values ({round(removal_percentage, 2)}%)"
+            "Removed %d rows containing null values (%.2f%%)",
+            rows_removed,
+            removal_percentage,
         )
         return df_cleaned, cleaning_stats
 
+    @staticmethod
+    def table_null_row_mask(table: pa.Table) -> np.ndarray:
+        """
+        Flag rows of an Arrow table that contain at least one null
+
+        Columns whose metadata reports no nulls are skipped without reading
+        their values, so a clean table costs one zeroed bool array.
+
+        Args:
+            table: Parsed CSV table
+
+        Returns:
+            Boolean numpy array, True for each row with a null
+        """
+        null_mask = np.zeros(table.num_rows, dtype=bool)
+        for column in table.columns:
+            if column.null_count == 0:
+                continue
+            column_mask = pc.is_null(column).to_numpy(zero_copy_only=False)
+            np.logical_or(null_mask, column_mask, out=null_mask)
+        return null_mask
+
+    @staticmethod
+    def remove_nulls_and_duplicates_table(
+        table: pa.Table, remove_duplicates: bool = True
+    ) -> Tuple[pa.Table, Dict[str, Any], Optional[Dict[str, Any]]]:
+        """
+        Remove rows with nulls, and duplicate rows if requested, from a parsed
+        Arrow table with a single filter
+
+        Null counts come from each column's Arrow metadata. Both row masks are
+        computed against the original rows, so sample row indices refer to the
+        uploaded file, and the table is filtered once. As in
+        remove_nulls_and_duplicates, the result matches removing nulls first.
+
+        Args:
+            table: Parsed CSV table; it is not modified
+            remove_duplicates: Whether to remove duplicate rows as well
+
+        Returns:
+            Tuple of (cleaned_table, null_stats, duplicate_stats)
+            - null_stats: Statistics as returned by remove_null_rows
+            - duplicate_stats: Statistics as returned by remove_duplicate_rows,
+              or None when duplicates are kept
+        """
+        rows_before = table.num_rows
+        null_counts = {
+            name: column.null_count
+            for name, column in zip(table.column_names, table.columns)
+        }
+        columns_with_nulls = [col for col, count in null_counts.items() if count > 0]
+
+        # pandas reads an integer column with blanks as float64; keep that type
+        # once the blank rows are filtered out, so downloads still write "2.0"
+        for i, column in enumerate(table.columns):
+            if pa.types.is_integer(column.type) and column.null_count:
+                table = table.set_column(
+                    i, table.field(i).name, column.cast(pa.float64())
+                )
+
+        null_mask = CSVProcessor.table_null_row_mask(table)
+        keep = ~null_mask
+        null_rows_removed = int(np.count_nonzero(null_mask))
+        rows_after_nulls = rows_before - null_rows_removed
+
+        # Only the removed rows are converted, for display
+        sample_rows_with_nulls = (
+            CSVProcessor._rows_to_records(
+                CSVProcessor._table_rows_to_df(table, np.flatnonzero(null_mask))
+            )
+            if null_rows_removed
+            else []
+        )
+        null_removal_percentage = (
+            (null_rows_removed / rows_before * 100) if rows_before > 0 else 0
+        )
+        null_stats = {
+            "rows_before": rows_before,
+            "rows_after": rows_after_nulls,
+            "rows_removed": null_rows_removed,
+            "removal_percentage": round(null_removal_percentage, 2),
+            "columns_count": table.num_columns,
+            "columns_with_nulls": columns_with_nulls,
+            "null_counts_by_column": null_counts,
+            "sample_removed_rows": sample_rows_with_nulls,
+        }
+        logger.info(
+            "Removed %d rows containing null values (%.2f%%)",
+            null_rows_removed,
+            null_removal_percentage,
+        )
+
+        duplicate_stats = None
+        if remove_duplicates:
+            # Row hashing runs on pandas; numeric columns convert as views of
+            # the table's buffers. A row duplicating one with nulls has nulls
+            # itself, so it is already dropped and not counted again. Hashing
+            # only the rows without nulls would first copy them out, which
+            # costs more than the hashes it saves, even with 30% null rows
+            duplicate_mask = CSVProcessor.duplicate_row_mask(
+                CSVProcessor.table_to_df(table)
+            ) & keep
+            keep &= ~duplicate_mask
+            duplicate_rows_removed = int(np.count_nonzero(duplicate_mask))
+            duplicate_removal_percentage = (
+                (duplicate_rows_removed / rows_after_nulls * 100)
+                if rows_after_nulls > 0
+                else 0
+            )
+            duplicate_stats = {
+                "rows_before": rows_after_nulls,
+                "rows_after": rows_after_nulls - duplicate_rows_removed,
+                "rows_removed": duplicate_rows_removed,
+                "removal_percentage": round(duplicate_removal_percentage, 2),
+                "duplicate_rows_sample": CSVProcessor._duplicate_sample_records(
+                    CSVProcessor._table_rows_to_df(
+                        table, np.flatnonzero(duplicate_mask)[:10]
+                    )
+                ),
+            }
+            logger.info(
+                "Removed %d duplicate rows (%.2f%%)",
+                duplicate_rows_removed,
+                duplicate_removal_percentage,
+            )
+
+        table_cleaned = table if keep.all() else table.filter(pa.array(keep))
+        return table_cleaned, null_stats, duplicate_stats
+
+    @staticmethod
+    def _table_rows_to_df(table: pa.Table, positions: np.ndarray) -> pd.DataFrame:
+        """Convert the rows of a table at positions, indexed by those positions"""
+        rows = CSVProcessor.table_to_df(
+            table.take(pa.array(positions, type=pa.int64())), self_destruct=True
+        )
+        rows.index = positions
+        return rows
+
+    @staticmethod
+    def duplicate_row_mask(df: pd.DataFrame) -> np.ndarray:
+        """
+        Flag rows that repeat an earlier row (keep="first" semantics)
+
+        Each row is reduced to a single uint64 hash, so detection is one hash-table
+        pass over a contiguous array instead of factorizing every column. Text
+        columns are swapped for their factorize codes first: hashing int codes
+        is about 3x faster than hashing every string cell, and the codes keep
+        equal values (and NaN) equal within a column.
+
+        Args:
+            df: pandas DataFrame to check
+
+        Returns:
+            Boolean numpy array, True for each duplicate row
+        """
+        # Positional, so frames with repeated column names work too
+        probe = df.copy(deep=False)
+        for position, dtype in enumerate(probe.dtypes):
+            # is_string_dtype also matches object columns
+            if pd.api.types.is_string_dtype(dtype):
+                probe.isetitem(position, pd.factorize(probe.iloc[:, position])[0])
+        row_hashes = pd.util.hash_pandas_object(probe, index=False).to_numpy()
+        return pd.Series(row_hashes).duplicated(keep="first").to_numpy()
+
+    @staticmethod
+    def count_duplicates(df: pd.DataFrame) -> int:
+        """
+        Count rows that repeat an earlier row
+
+        Args:
+            df: pandas DataFrame to check
+
+        Returns:
+            Number of duplicate rows
+        """
+        return int(np.count_nonzero(CSVProcessor.duplicate_row_mask(df)))
+
+    @staticmethod
+    def _duplicate_sample_records(rows: pd.DataFrame) -> List[Dict[str, Any]]:
+        """Duplicate rows as [{"row_index", "data"}] records with values as strings"""
+        sample_duplicate_rows = []
+        for idx in rows.index:
+            row = rows.loc[idx]
+            row_data = {}
+            for column in rows.columns:
+                row_data[column] = (
+                    str(row[column]) if not pd.isna(row[column]) else None
+                )
+            sample_duplicate_rows.append({"row_index": int(idx), "data": row_data})
+        return sample_duplicate_rows
+
     @staticmethod
     def remove_duplicate_rows(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, Any]]:
         """
@@ -205,22 +1114,16 @@ class CSVProcessor:
         rows_before = len(df)
 
         # Identify duplicate rows
-        duplicated_mask = df.duplicated(keep="first")
-        duplicate_indices = df[duplicated_mask].index.tolist()
+        duplicated_mask = CSVProcessor.duplicate_row_mask(df)
+        duplicate_indices = df.index[duplicated_mask].tolist()
 
         # Extract sample of duplicate rows for preview (limit to 10)
-        sample_duplicate_rows = []
-        for idx in duplicate_indices[:10]:
-            row = df.loc[idx]
-            row_data = {}
-            for column in df.columns:
-                row_data[column] = (
-                    str(row[column]) if not pd.isna(row[column]) else None
-                )
-            sample_duplicate_rows.append({"row_index": int(idx), "data": row_data})
+        sample_duplicate_rows = CSVProcessor._duplicate_sample_records(
+            df.loc[duplicate_indices[:10]]
+        )
 
         # Remove duplicates
-        df_cleaned = df.drop_duplicates(keep="first")
+        df_cleaned = df.loc[~duplicated_mask]
 
         # Calculate cleaning stats
         rows_after = len(df_cleaned)
@@ -239,52 +1142,109 @@ class CSVProcessor:
         }
 
         logger.info(
-            f"Removed {rows_removed} duplicate rows ({round(removal_percentage, 2)}%)"
+            "Removed %d duplicate rows (%.2f%%)", rows_removed, removal_percentage
+        )
+        return df_cleaned, cleaning_stats
+
+    @staticmethod
+    def remove_nulls_and_duplicates(
+        df: pd.DataFrame,
+    ) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """
+        Remove rows with nulls and duplicate rows in a single slice
+
+        Both masks are computed on the original frame. A row that duplicates a
+        row with nulls has the same nulls itself, so the result matches running
+        remove_null_rows followed by remove_duplicate_rows.
+
+        Args:
+            df: pandas DataFrame to clean
+
+        Returns:
+            Tuple of (cleaned_df, cleaning_stats)
+            - cleaned_df: DataFrame with null and duplicate rows removed
+            - cleaning_stats: Row counts removed by each rule
+        """
+        rows_before = len(df)
+
+        null_mask = CSVProcessor.row_null_mask(df)
+        dup_mask = CSVProcessor.duplicate_row_mask(df)
+        df_cleaned = df.loc[~(null_mask | dup_mask)]
+
+        null_rows_removed = int(np.count_nonzero(null_mask))
+        duplicate_rows_removed = int(np.count_nonzero(dup_mask & ~null_mask))
+        rows_after_nulls = rows_before - null_rows_removed
+        rows_after = len(df_cleaned)
+        rows_removed = rows_before - rows_after
+
+        # Percentages mirror the sequential operations: duplicates are measured
+        # against the frame left after null removal
+        cleaning_stats = {
+            "rows_before": rows_before,
+            "rows_after": rows_after,
+            "rows_removed": rows_removed,
+            "null_rows_removed": null_rows_removed,
+            "null_removal_percentage": round(
+                (null_rows_removed / rows_before * 100) if rows_before > 0 else 0, 2
+            ),
+            "duplicate_rows_removed": duplicate_rows_removed,
+            "duplicate_removal_percentage": round(
+                (duplicate_rows_removed / rows_after_nulls * 100)
+                if rows_after_nulls > 0
+                else 0,
+                2,
+            ),
+        }
+
+        logger.info(
+            "Removed %d null rows and %d duplicate rows",
+            null_rows_removed,
+            duplicate_rows_removed,
         )
         return df_cleaned, cleaning_stats
 
     @staticmethod
-    def identify_null_rows(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    def identify_null_rows(
+        df: pd.DataFrame,
+        null_stats: Optional[NullStats] = None,
+        sample_limit: Optional[int] = NULL_ROW_SAMPLE_LIMIT,
+    ) -> Tuple[pd.DataFrame, Dict[str, Any]]:
         """
         Identify rows containing any null values in the DataFrame without removing them
 
         Args:
             df: pandas DataFrame to analyze
+            null_stats: Optional result of compute_null_stats(df)
+            sample_limit: Maximum number of null rows returned as records;
+                None returns every null row
 
         Returns:
             Tuple of (df, stats)
             - df: Original DataFrame (unchanged)
             - stats: Statistics about null rows
         """
-        # Make a copy to avoid modifying the original
-        df_copy = df.copy()
-
         # Get original shape
-        rows_before = len(df_copy)
-
-        # Track which columns had null values and which rows were removed
-        null_counts = df_copy.isnull().sum()
-        columns_with_nulls = null_counts[null_counts > 0].index.tolist()
-
-        # Get row indices with null values
-        null_mask = df_copy.isnull().any(axis=1)
-        rows_with_nulls = df_copy[null_mask].index.tolist()
-
-        # Get all rows with nulls for display
-        all_rows_with_nulls = []
-        if rows_with_nulls:
-            for idx in rows_with_nulls:
-                row_data = df_copy.loc[idx].to_dict()
-                # Mark null values in the data
-                for col, val in row_data.items():
-                    if pd.isna(val):
-                        row_data[col] = (
-                            None  # Explicitly set to None for JSON serialization
-                        )
-                all_rows_with_nulls.append({"row_index": int(idx), "data": row_data})
+        rows_before = len(df)
+
+        # Track which columns had null values and which rows contain them
+        if null_stats is None:
+            null_stats = CSVProcessor.compute_null_stats(df)
+        null_counts, null_mask = null_stats.counts_by_column, null_stats.row_mask
+        columns_with_nulls = [col for col, count in null_counts.items() if count > 0]
+        null_positions = np.flatnonzero(null_mask)
+
+        # Only materialize the rows that will be displayed; counts come from the mask
+        sample_positions = (
+            null_positions if sample_limit is None else null_positions[:sample_limit]
+        )
+        sample_rows_with_nulls = (
+            CSVProcessor._rows_to_records(df.iloc[sample_positions])
+            if sample_positions.size
+            else []
+        )
 
         # Calculate stats
-        rows_removed = len(rows_with_nulls)
+        rows_removed = len(null_positions)
         removal_percentage = (
             (rows_removed / rows_before * 100) if rows_before > 0 else 0
         )
@@ -295,16 +1255,217 @@ class CSVProcessor:
             "rows_after": rows_before - rows_removed,
             "rows_removed": rows_removed,
             "removal_percentage": round(removal_percentage, 2),
-            "columns_count": len(df_copy.columns),
+            "columns_count": len(df.columns),
             "columns_with_nulls": columns_with_nulls,
-            "null_counts_by_column": null_counts.to_dict(),
-            "sample_removed_rows": all_rows_with_nulls,
+            "null_counts_by_column": null_counts,
+            "sample_removed_rows": sample_rows_with_nulls,
         }
 
         logger.info(
-            f"Identified {rows_removed} rows containing null values ({round(removal_percentage, 2)}%)"
+            "Identified %d rows containing null values (%.2f%%)",
+            rows_removed,
+            removal_percentage,
         )
-        return df_copy, cleaning_stats
+        return df, cleaning_stats
+
+    @staticmethod
+    def _clean_number_strings(values: pd.Series) -> pd.Series:
+        """Strip number formatting from a column's values as strings"""
+        # Literal replaces run as native substring kernels (Arrow compute for
+        # pyarrow-backed strings)
+        clean_series = values.astype(str)
+        for old, new in NUMBER_FORMAT_REPLACEMENTS:
+            clean_series = clean_series.str.replace(old, new, regex=False)
+        return clean_series
+
+    @staticmethod
+    def parse_numbers(values: pd.Series) -> pd.Series:
+        """
+        Parse number strings to numeric, coercing failures to NaN
+
+        Arrow-backed strings are cast natively when every value parses, which is
+        far cheaper than to_numeric's per-value path; int64 is kept when pandas
+        would produce it. Anything Arrow rejects falls back to pd.to_numeric.
+
+        Args:
+            values: String values, with any number formatting already stripped
+
+        Returns:
+            Numeric Series with the same index
+        """
+        dtype = values.dtype
+        if isinstance(dtype, pd.StringDtype) and dtype.storage == "pyarrow":
+            arrow_values = values.array.__arrow_array__()
+            numeric = None
+            try:
+                # A failing cast costs about as much as a full one, so rule out
+                # text columns on a short slice before casting everything
+                pc.cast(arrow_values.slice(0, NUMERIC_PROBE_SIZE), pa.float64())
+                numeric = pc.cast(arrow_values, pa.float64())
+            except pa.ArrowInvalid:
+                pass
+            if numeric is not None:
+                # pandas only yields integers for null-free integer literals;
+                # check for them first, as a failing int cast is slow
+                if arrow_values.null_count == 0 and pc.all(
+                    pc.match_substring_regex(arrow_values, INTEGER_LITERAL_PATTERN)
+                ).as_py():
+                    try:
+                        numeric = pc.cast(arrow_values, pa.int64())
+                    except pa.ArrowInvalid:
+                        # Out of int64 range; keep the float parse
+                        pass
+                return pd.Series(numeric.to_numpy(), index=values.index, name=values.name)
+
+        head = values.iloc[:NUMERIC_PROBE_SIZE]
+        if (
+            (values.dtype == object or isinstance(values.dtype, pd.StringDtype))
+            and len(head) > 0
+            and head.nunique() * REPEATED_VALUES_FACTOR <= len(head)
+        ):
+            return CSVProcessor._parse_repeated_numbers(values)
+
+        return pd.to_numeric(values, errors="coerce")
+
+    @staticmethod
+    def parse_number_columns(df: pd.DataFrame, columns: List[str]) -> List[pd.Series]:
+        """
+        Run parse_numbers over several columns, in parallel on wide frames
+
+        Args:
+            df: pandas DataFrame holding the columns
+            columns: Names of the columns to parse
+
+        Returns:
+            Numeric Series for each column, in the order given
+        """
+        # Arrow casts and to_numeric release the GIL, so threads overlap the
+        # columns without copying data, as in convert_column_types
+        max_workers = min(len(columns), os.cpu_count() or 1)
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return list(
+                    executor.map(
+                        lambda c: CSVProcessor.parse_numbers(df[c]), columns
+                    )
+                )
+        return [CSVProcessor.parse_numbers(df[c]) for c in columns]
+
+    @staticmethod
+    def _parse_repeated_numbers(values: pd.Series) -> pd.Series:
+        """
+        Parse a low-cardinality text column through its distinct values
+
+        to_numeric parses every string in Python; codes from one hashing pass
+        map the parsed distinct values back onto the rows. The result matches
+        pd.to_numeric(values, errors="coerce").
+
+        Args:
+            values: String values, with any number formatting already stripped
+
+        Returns:
+            Numeric Series with the same index
+        """
+        codes, uniques = pd.factorize(values)
+        parsed = np.asarray(pd.to_numeric(uniques, errors="coerce"))
+        missing = codes < 0
+        if missing.any():
+            # Nulls make to_numeric return floats; their code -1 picks the NaN
+            # appended at the end
+            parsed = np.append(parsed.astype(np.float64), np.nan)
+        return pd.Series(parsed[codes], index=values.index, name=values.name)
+
+    @staticmethod
+    def downcast_numeric(values: pd.Series, floats: bool = True) -> pd.Series:
+        """
+        Shrink a parsed numeric column to the smallest dtype that holds it exactly
+
+        Integers take the smallest fitting integer type. Floats only become
+        float32 when every value survives the round trip, since pandas' own
+        float downcast tolerates rounding (0.1 would change).
+
+        Args:
+            values: Numeric Series, e.g. from parse_numbers
+            floats: Whether float64 columns may become float32; turn off for
+                frames that are written out or modelled, since float32 prints
+                differently (1234567.0 becomes 1.234567e+06)
+
+        Returns:
+            Series with the smaller dtype, or the input unchanged
+        """
+        if pd.api.types.is_integer_dtype(values.dtype):
+            return pd.to_numeric(values, downcast="integer")
+
+        if floats and values.dtype == np.float64:
+            as_float32 = values.to_numpy().astype(np.float32)
+            if np.array_equal(
+                as_float32.astype(np.float64), values.to_numpy(), equal_nan=True
+            ):
+                return pd.Series(as_float32, index=values.index, name=values.name)
+
+        return values
+
+    @staticmethod
+    def _infer_numeric(
+        col: Any, values: pd.Series
+    ) -> Tuple[Any, Optional[pd.Series], Optional[Dict[str, Any]]]:
+        """
+        Decide whether one text column should become numeric, and convert it if so
+
+        Args:
+            col: Column name, passed through for the caller
+            values: The column's values
+
+        Returns:
+            Tuple of (col, numeric_series, conversion_detail); the last two are
+            None when the column stays as it is
+        """
+        try:
+            # Estimate the success rate from a fixed-size sample of the
+            # non-null values; nulls always count as failures
+            non_null = values.dropna()
+            if len(non_null) > NUMERIC_PROBE_SIZE:
+                probe = non_null.sample(n=NUMERIC_PROBE_SIZE, random_state=0)
+            else:
+                probe = non_null
+            if len(probe) == 0:
+                return col, None, None
+            probe_numeric = pd.to_numeric(
+                CSVProcessor._clean_number_strings(probe), errors="coerce"
+            )
+            # Integer ratio with one division, so a fully probed column gets
+            # exactly the same rate as counting every value
+            success_rate = (int(probe_numeric.notna().sum()) * len(non_null)) / (
+                len(probe) * len(values)
+            )
+
+            # Only convert if 80% or more values can be converted successfully
+            if success_rate < 0.8:
+                return col, None, None
+
+            # Convert the full column with coercion
+            clean_series = CSVProcessor._clean_number_strings(values)
+            # Only integers are downcast: the cleaned frame is downloaded
+            # and modelled, where float32 would change the printed values
+            numeric_series = CSVProcessor.downcast_numeric(
+                CSVProcessor.parse_numbers(clean_series), floats=False
+            )
+
+            # Report the exact rate now that the full column is parsed
+            valid_count = int(numeric_series.notna().sum())
+            conversion_detail = {
+                "original_type": str(values.dtype),
+                "new_type": str(numeric_series.dtype),
+                "downcasted_to": str(numeric_series.dtype),
+                "success_rate": valid_count / len(values),
+                "values_before_conversion": len(values),
+                "valid_numeric_values": valid_count,
+                "null_values_after": len(values) - valid_count,
+            }
+            return col, numeric_series, conversion_detail
+        except Exception as e:
+            logger.debug("Error converting column '%s' to numeric: %s", col, e)
+            return col, None, None
 
     @staticmethod
     def convert_column_types(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, Any]]:
@@ -316,6 +1477,8 @@ class CSVProcessor:
         2. Convert those columns to numeric types if at least 80% of values can be converted
         3. Preserve specific columns that should remain as strings even if they look numeric
            (like IDs, zip codes, phone numbers)
+        4. Shrink integer columns to the smallest dtype that holds their values;
+           float columns stay float64, so downloads print them unchanged
 
         Args:
             df: pandas DataFrame to process
@@ -325,8 +1488,9 @@ class CSVProcessor:
             - processed_df: DataFrame with converted column types
             - conversion_stats: Statistics about the conversions including before/after types
         """
-        # Make a copy to avoid modifying the original
-        df_converted = df.copy()
+        # Shallow copy: converted columns are assigned as new arrays, so the
+        # caller's frame is untouched without duplicating every column upfront
+        df_converted = df.copy(deep=False)
 
         # Track conversions for reporting
         conversions = {
@@ -337,60 +1501,31 @@ class CSVProcessor:
             "conversion_details": {},  # New field with detailed info about each conversion
         }
 
-        # Record original types
-        for col in df_converted.columns:
-            conversions["original_types"][col] = str(df_converted[col].dtype)
-
-        # Columns that should not be converted even if they look numeric
-        exclude_patterns = [
-            "id",
-            "code",
-            "phone",
-            "zip",
-            "postal",
-            "year",
-            "ssn",
-            "identifier",
-            "password",
-        ]
-
-        # Function to check if a column should be excluded from conversion
-        def should_exclude(col_name):
-            col_lower = col_name.lower()
-            return any(pattern in col_lower for pattern in exclude_patterns)
-
-        # Function to check if a value can be converted to numeric
-        def is_numeric_value(val):
-            # Handle null values
-            if pd.isna(val) or val == "":
-                return pd.NA
-
-            # Convert to string for cleaning
-            val_str = str(val).strip()
-
-            # Clean common number formatting
-            val_clean = (
-                val_str.replace(",", "")  # Remove thousands separators
-                .replace("$", "")  # Remove dollar signs
-                .replace("%", "")  # Remove percent signs
-                .replace("−", "-")  # Replace unicode minus with standard minus
-            )
-
-            # Try converting to float
-            try:
-                return float(val_clean)
-            except:
-                return pd.NA
+        # Record original types and size
+        conversions["original_types"] = dict(
+            zip(df_converted.columns.tolist(), map(str, df_converted.dtypes))
+        )
+        bytes_before = int(df_converted.memory_usage(index=False).sum())
+
+        # Columns that should not be converted even if they look numeric,
+        # matched once per column with a single precompiled regex
+        excluded_cols = {
+            col
+            for col in df_converted.columns
+            if NUMERIC_EXCLUDE_RE.search(str(col).lower())
+        }
 
-        # Attempt numeric conversions for each column
+        # Pick the string/object columns worth probing; the per-column work
+        # below is independent, so it can run in parallel
+        candidate_cols = []
         for col in df_converted.columns:
             # Skip columns that are already numeric
             if pd.api.types.is_numeric_dtype(df_converted[col]):
                 continue
 
             # Skip columns that shouldn't be converted based on name
-            if should_exclude(col):
-                logger.debug(f"Skipping column '{col}' based on name pattern")
+            if col in excluded_cols:
+                logger.debug("Skipping column '%s' based on name pattern", col)
                 continue
 
             # Only process string or object columns
@@ -400,55 +1535,57 @@ class CSVProcessor:
             ):
                 continue
 
-            try:
-                # Apply numeric conversion with coercion to the column
-                original_values = df_converted[col].copy()
-
-                # Try to convert each value and count success rate
-                numeric_values = original_values.apply(is_numeric_value)
-                success_rate = numeric_values.notna().mean()
-
-                # Only convert if 80% or more values can be converted successfully
-                if success_rate >= 0.8:
-                    # Apply the actual conversion to the DataFrame
-                    clean_series = (
-                        df_converted[col]
-                        .astype(str)
-                        .str.replace("$", "", regex=False)
-                        .str.replace("%", "", regex=False)
-                        .str.replace(",", "", regex=False)
-                        .str.replace("−", "-", regex=False)  # Unicode minus
+            candidate_cols.append(col)
+
+        # String replaces and to_numeric release the GIL in Arrow/numpy
+        # kernels, so threads overlap on wide frames without copying data
+        max_workers = min(len(candidate_cols), os.cpu_count() or 1)
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(
+                    executor.map(
+                        lambda c: CSVProcessor._infer_numeric(c, df_converted[c]),
+                        candidate_cols,
                     )
+                )
+        else:
+            results = [
+                CSVProcessor._infer_numeric(c, df_converted[c]) for c in candidate_cols
+            ]
 
-                    # Convert to numeric with coercion
-                    numeric_series = pd.to_numeric(clean_series, errors="coerce")
-
-                    # Record detailed stats about this conversion
-                    conversion_detail = {
-                        "original_type": str(df_converted[col].dtype),
-                        "new_type": str(numeric_series.dtype),
-                        "success_rate": float(success_rate),
-                        "values_before_conversion": len(original_values),
-                        "valid_numeric_values": int(numeric_series.notna().sum()),
-                        "null_values_after": int(numeric_series.isna().sum()),
-                    }
-
-                    # Apply the conversion
-                    df_converted[col] = numeric_series
-
-                    # Record the conversion
-                    conversions["numeric_columns"].append(col)
-                    conversions["conversion_details"][col] = conversion_detail
+        # Apply the conversions in column order once every column is decided
+        for col, numeric_series, conversion_detail in results:
+            if numeric_series is None:
+                continue
+            df_converted[col] = numeric_series
+            conversions["numeric_columns"].append(col)
+            conversions["conversion_details"][col] = conversion_detail
+
+            logger.info(
+                "Converted column '%s' to numeric type with %.1f%% success rate",
+                col,
+                conversion_detail["success_rate"] * 100,
+            )
 
-                    logger.info(
-                        f"Converted column '{col}' to numeric type with {success_rate:.1%} success rate"
-                    )
-            except Exception as e:
-                logger.debug(f"Error converting column '{col}' to numeric: {e}")
+        # Integer columns that were numeric already are shrunk the same way as
+        # converted ones, so the frame handed on moves fewer bytes; floats are
+        # left at float64 for the download and the models
+        converted_cols = set(conversions["numeric_columns"])
+        for col in df_converted.columns:
+            if col in converted_cols:
+                continue
+            values = df_converted[col]
+            if pd.api.types.is_numeric_dtype(values) and not (
+                pd.api.types.is_bool_dtype(values)
+            ):
+                downcast = CSVProcessor.downcast_numeric(values, floats=False)
+                if downcast is not values:
+                    df_converted[col] = downcast
 
         # Record new types after all conversions
-        for col in df_converted.columns:
-            conversions["new_types"][col] = str(df_converted[col].dtype)
+        conversions["new_types"] = dict(
+            zip(df_converted.columns.tolist(), map(str, df_converted.dtypes))
+        )
 
         # Generate summary statistics
         conversion_stats = {
@@ -464,6 +1601,8 @@ class CSVProcessor:
                 for col in conversions["numeric_columns"]
             },
             "conversion_details": conversions.get("conversion_details", {}),
+            "memory_saved_bytes": bytes_before
+            - int(df_converted.memory_usage(index=False).sum()),
         }
 
         # Add a human-readable summary of the conversions
@@ -481,7 +1620,7 @@ class CSVProcessor:
             conversion_stats["summary"] = "No columns were converted to numeric type"
 
         logger.info(
-            f"Converted {len(conversions['numeric_columns'])} columns to numeric"
+            "Converted %d columns to numeric", len(conversions["numeric_columns"])
         )
         return df_converted, conversion_stats
 
@@ -527,3 +1666,12 @@ class CSVProcessor:
             "columns": columns,
             "data": data_points
         }
+
+
+# Singletons
+parsed_table_cache = UploadResultCache(
+    settings.PARSED_CSV_CACHE_SIZE,
+    max_bytes=settings.PARSED_CSV_CACHE_MAX_MB * 1024 * 1024,
+    sizeof=lambda table: table.nbytes,
+)
+csv_processor = CSVProcessor()
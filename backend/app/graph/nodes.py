@@ -42,13 +42,16 @@ def parse_csv(state: DashboardState) -> dict:
         df = pd.read_csv(io.BytesIO(raw), on_bad_lines="skip")
 
     columns = []
-    for col in df.columns:
+    # Null counts for all columns come from one vectorized count() pass
+    null_counts = (len(df) - df.count()).tolist()
+    for col, nulls in zip(df.columns, null_counts):
         series = df[col]
+        unique = int(series.nunique())
         if pd.api.types.is_numeric_dtype(series):
             col_type = "numeric"
         elif pd.api.types.is_datetime64_any_dtype(series):
             col_type = "datetime"
-        elif series.nunique() <= 30:
+        elif unique <= 30:
             col_type = "categorical"
         else:
             col_type = "text"
@@ -56,8 +59,8 @@ def parse_csv(state: DashboardState) -> dict:
         info = {
             "name": col,
             "type": col_type,
-            "nulls": int(series.isnull().sum()),
-            "unique": int(series.nunique()),
+            "nulls": int(nulls),
+            "unique": unique,
             "sample_values": series.dropna().head(5).astype(str).tolist(),
             "min": float(series.min()) if col_type == "numeric" else None,
             "max": float(series.max()) if col_type == "numeric" else None,
@@ -11,6 +11,7 @@ import logging
 
 from .config import settings
 from .api.api_v1 import api_router
+from .api.responses import ORJSONResponse
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -22,6 +23,7 @@ app = FastAPI(
     version=settings.VERSION,
     description=settings.DESCRIPTION,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
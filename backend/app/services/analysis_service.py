@@ -6,10 +6,11 @@ from typing import Dict, Any
 import logging
 from fastapi import UploadFile
 
-from ..core.csv_processor import CSVProcessor
+from ..core.concurrency import run_cpu_bound
+from ..core.csv_processor import csv_processor
 from ..core.exceptions import CSVProcessingError
-from ..models.responses import ColumnInfo
 from ..config import settings
+from ..utils.file_utils import get_file_size_mb, get_upload_size
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +19,7 @@ class AnalysisService:
     """Service for handling CSV analysis operations"""
 
     def __init__(self):
-        self.csv_processor = CSVProcessor()
+        self.csv_processor = csv_processor
 
     async def analyze_csv_comprehensive(self, file: UploadFile) -> Dict[str, Any]:
         """
@@ -35,24 +36,34 @@ class AnalysisService:
         Raises:
             CSVProcessingError: If file processing fails
         """
-        try:
-            # Read file content
-            content = await file.read()
-
-            # Process CSV file
-            df = self.csv_processor.generate_df_from_csv(content)
+        # Parsing, column statistics and correlations are all CPU-bound, so the
+        # whole analysis runs on a worker thread rather than just the parse
+        return await run_cpu_bound(self._analyze_csv_comprehensive, file)
 
-            # Get column information
-            columns_info_raw = self.csv_processor.get_column_info(df)
-            columns_info = [ColumnInfo(**col_info) for col_info in columns_info_raw]
-
-            # Get preview data for both basic and detailed views
-            preview_data_basic = self.csv_processor.get_preview_data(
-                df, num_rows=settings.MAX_PREVIEW_ROWS
+    def _analyze_csv_comprehensive(self, file: UploadFile) -> Dict[str, Any]:
+        """Blocking body of analyze_csv_comprehensive; runs on a worker thread."""
+        try:
+            # Parse the upload straight from its spooled file, and read null and
+            # distinct counts off the Arrow table before it is handed to pandas
+            table = self.csv_processor.generate_table_from_upload(file)
+            column_stats = self.csv_processor.table_column_stats(table)
+            df = self.csv_processor.table_to_df(table)
+            file_size = get_upload_size(file)
+
+            # Get column information; the dicts already have the ColumnInfo
+            # fields, so they go into the response as they are
+            columns_info = self.csv_processor.get_column_info(
+                df, column_stats=column_stats
             )
-            preview_data_detailed = self.csv_processor.get_preview_data(
-                df, num_rows=settings.DEFAULT_PREVIEW_ROWS
+
+            # Get preview data for both basic and detailed views; both are head
+            # slices, so build the longer one once and take the other from it
+            preview_rows = self.csv_processor.get_preview_data(
+                df,
+                num_rows=max(settings.MAX_PREVIEW_ROWS, settings.DEFAULT_PREVIEW_ROWS),
             )
+            preview_data_basic = preview_rows[: settings.MAX_PREVIEW_ROWS]
+            preview_data_detailed = preview_rows[: settings.DEFAULT_PREVIEW_ROWS]
 
             # Create comprehensive response combining both basic and detailed info
             comprehensive_result = {
@@ -63,18 +74,9 @@ class AnalysisService:
                 "data": preview_data_basic,
                 # Detailed information from enhanced analysis
                 "filename": file.filename,
-                "file_size": len(content),
-                "file_size_mb": round(len(content) / (1024 * 1024), 2),
-                "columns_info": [
-                    {
-                        "name": col.name,
-                        "data_type": col.data_type,
-                        "null_count": col.null_count,
-                        "unique_count": col.unique_count,
-                        "sample_values": col.sample_values,
-                    }
-                    for col in columns_info
-                ],
+                "file_size": file_size,
+                "file_size_mb": round(get_file_size_mb(file_size), 2),
+                "columns_info": columns_info,
                 "preview_data": preview_data_detailed,
                 "correlation_matrix": self.csv_processor.get_correlation_matrix(df),
             }
@@ -85,3 +87,7 @@ class AnalysisService:
         except Exception as e:
             logger.error(f"Failed to analyze CSV file {file.filename}: {e}")
             raise CSVProcessingError(f"Failed to analyze CSV file: {str(e)}")
+
+
+# Singleton
+analysis_service = AnalysisService()
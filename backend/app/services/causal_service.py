@@ -6,16 +6,18 @@ from __future__ import annotations
 
 from typing import Dict, Any, List, Optional, Tuple
 import io
+import math
 import pandas as pd
 import numpy as np
 import logging
 import networkx as nx
 
 from dowhy import CausalModel
-from causallearn.utils.GraphUtils import GraphUtils
 from causallearn.search.ConstraintBased.PC import pc
 from causallearn.utils.cit import fisherz
 
+from ..core.csv_processor import csv_processor
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,11 +27,20 @@ class CausalService:
     def __init__(self):
         pass
 
-    def _learn_graph_pc(self, df: pd.DataFrame, alpha: float = 0.05) -> Any:
+    def _learn_graph_pc(
+        self, df: pd.DataFrame, var_names: List[str], alpha: float = 0.05
+    ) -> Any:
+        # var_names is df's column list, preserved for serialization
         data = df.to_numpy(dtype=float)
-        # Variable names preserved for serialization
-        var_names = list(df.columns)
-        cg = pc(data, indep_test_func=fisherz, alpha=alpha, node_names=var_names)
+        # causal-learn's Fisher-Z test already builds the correlation matrix once
+        # and caches p-values per test; the progress bar only adds stderr noise
+        cg = pc(
+            data,
+            alpha=alpha,
+            indep_test=fisherz,
+            show_progress=False,
+            node_names=var_names,
+        )
         return cg
 
     def _graph_to_edge_sets(self, cg) -> Tuple[List[Dict[str, str]], List[Dict[str, str]]]:
@@ -37,67 +48,67 @@ class CausalService:
         - directed_edges: only edges without reverse counterpart (safe for DoWhy)
         - viz_edges: directed_edges plus one representative for each undirected pair
         """
-        G = GraphUtils.to_nx_graph(cg.G, labels=cg.G.names)
-        dir_edges: List[Dict[str, str]] = []
-        viz_edges: List[Dict[str, str]] = []
-        edge_set = set(G.edges())
-        seen_undirected = set()
-        for u, v in G.edges():
-            u = str(u)
-            v = str(v)
-            if (v, u) in edge_set:
-                # undirected pair; add only once with a deterministic orientation for viz
-                key = tuple(sorted((u, v)))
-                if key not in seen_undirected:
-                    seen_undirected.add(key)
-                    # Choose orientation alphabetically for visualization
-                    a, b = key
-                    viz_edges.append({"source": a, "target": b})
-            else:
-                # true directed edge
-                e = {"source": u, "target": v}
-                dir_edges.append(e)
-                viz_edges.append(e)
-        return dir_edges, viz_edges
+        # causal-learn's endpoint matrix: graph[i, j] == -1 and graph[j, i] == 1
+        # encode i -> j; -1/-1 is undirected and 1/1 bidirected. Mark i -> j as
+        # present unless the edge is oriented the other way, then split the
+        # pairs with two vectorized masks instead of walking a NetworkX graph
+        endpoints = cg.G.graph
+        labels = [str(node.get_name()) for node in cg.G.get_nodes()]
+        into_row = (endpoints == 1) & (endpoints.T == -1)
+        adjacent = (endpoints != 0) & ~into_row
 
-    def _edges_to_dot(self, nodes: List[str], edges: List[Dict[str, str]]) -> str:
-        # Build a DOT DAG string for DoWhy
-        lines = ["digraph G {"]
-        for n in nodes:
-            lines.append(f'  "{n}";')
-        for e in edges:
-            lines.append(f'  "{e["source"]}" -> "{e["target"]}";')
-        lines.append("}")
-        return "\n".join(lines)
+        dir_edges: List[Dict[str, str]] = [
+            {"source": labels[i], "target": labels[j]}
+            for i, j in np.argwhere(adjacent & ~adjacent.T)
+        ]
+        viz_edges: List[Dict[str, str]] = list(dir_edges)
+        for i, j in np.argwhere(np.triu(adjacent & adjacent.T, 1)):
+            # Choose orientation alphabetically for visualization
+            a, b = sorted((labels[i], labels[j]))
+            viz_edges.append({"source": a, "target": b})
+        return dir_edges, viz_edges
 
     def _select_columns_for_pc(
-        self, df: pd.DataFrame, treatment: str, outcome: str
+        self,
+        df: pd.DataFrame,
+        treatment: str,
+        outcome: str,
+        columns: List[str],
+        n: int,
     ) -> List[str]:
         """Select a safe subset of columns for PC based on sample size.
         Keep treatment/outcome and add up to a capped number of other variables ranked by
         absolute correlation with outcome, ensuring p < n+1 to avoid math domain errors in Fisher-Z.
+        columns and n are df's column list and row count, as already known to the caller.
         """
-        n, p = df.shape
         # Always include treatment & outcome
-        base = [c for c in [treatment, outcome] if c in df.columns]
+        base = [c for c in [treatment, outcome] if c in columns]
         # Maximum variables allowed so that p < n + 1 and keep small for speed
-        max_vars_allowed = max(2, min(df.shape[1], max(2, min(n - 1, 12))))
+        max_vars_allowed = max(2, min(len(columns), max(2, min(n - 1, 12))))
         if len(base) >= max_vars_allowed:
             return base[:max_vars_allowed]
 
         # Rank remaining columns by correlation with outcome (abs), fallback to variance if needed
-        remaining = [c for c in df.columns if c not in base]
-        scores = {}
-        for c in remaining:
-            try:
-                if outcome in df.columns:
-                    corr = df[c].astype(float).corr(df[outcome].astype(float))
-                    scores[c] = 0.0 if pd.isna(corr) else abs(float(corr))
-                else:
-                    scores[c] = float(df[c].astype(float).std() or 0.0)
-            except Exception:
-                scores[c] = 0.0
-        ranked = sorted(remaining, key=lambda k: scores.get(k, 0.0), reverse=True)
+        remaining = [c for c in columns if c not in base]
+        if not remaining:
+            return base
+        # Score every column in one pass over a 2D float array: correlations are
+        # a single matrix-vector product of the centered columns with the outcome
+        values = df[remaining].to_numpy(dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if outcome in base:
+                centered = values - values.mean(axis=0)
+                target = df[outcome].to_numpy(dtype=np.float64)
+                target = target - target.mean()
+                # einsum sums the squares without a full squared temporary
+                norms = np.sqrt(np.einsum("ij,ij->j", centered, centered))
+                scores = np.abs((target @ centered) / (norms * np.sqrt(target @ target)))
+            else:
+                scores = values.std(axis=0, ddof=1)
+        # Zero-variance columns have no defined correlation; rank them last
+        scores = np.nan_to_num(scores, nan=0.0)
+        # Stable sort keeps column order among ties, like sorted(reverse=True)
+        ranked = [remaining[i] for i in np.argsort(-scores, kind="stable")]
         take = max_vars_allowed - len(base)
         return base + ranked[: max(0, take)]
 
@@ -116,20 +127,32 @@ class CausalService:
         - Build DoWhy model from DataFrame and learned structure
         - Identify and estimate the causal effect (linear, backdoor)
         """
-        # Coerce to numeric where possible
-        df_num = df.copy()
-        for col in df_num.columns:
-            if not pd.api.types.is_numeric_dtype(df_num[col]):
-                df_num[col] = pd.to_numeric(df_num[col], errors="coerce")
+        # Coerce to numeric where possible; numeric columns are shared with the
+        # caller's frame rather than copied, as only new columns are assigned.
+        # Arrow-backed text columns are cast natively, falling back to
+        # pd.to_numeric's coercion when any value does not parse
+        # The column list is read once and shared by every step below, since
+        # coercion and dropna keep the columns as they are
+        cols = df.columns.tolist()
+        df_num = df.copy(deep=False)
+        text_cols = [c for c in cols if not pd.api.types.is_numeric_dtype(df_num[c])]
+        parsed = csv_processor.parse_number_columns(df_num, text_cols)
+        for col, numeric in zip(text_cols, parsed):
+            df_num[col] = numeric
         df_num = df_num.dropna()
 
-        if treatment not in df_num.columns or outcome not in df_num.columns:
+        if treatment not in cols or outcome not in cols:
             raise ValueError("treatment or outcome not found in dataframe")
 
-        # Drop constant columns (zero variance) to avoid degenerate correlations
-        non_const_cols = [
-            c for c in df_num.columns if df_num[c].nunique(dropna=True) > 1
-        ]
+        # Drop constant columns (zero variance) to avoid degenerate correlations.
+        # No NaN is left after dropna, so a column is constant exactly when every
+        # value equals its first; one vectorized comparison covers all columns
+        values = df_num.to_numpy(dtype=np.float64)
+        if len(values):
+            varies = (values != values[0]).any(axis=0)
+        else:
+            varies = np.zeros(values.shape[1], dtype=bool)
+        non_const_cols = [c for c, v in zip(cols, varies) if v]
         if len(non_const_cols) < 2:
             # Not enough signal, fallback to minimal edge set
             edges_directed = [{"source": treatment, "target": outcome}]
@@ -138,11 +161,13 @@ class CausalService:
             df_pc_base = df_num[non_const_cols]
             # Select a safe subset of variables for PC to avoid small-sample domain errors
             # Allow more variables if sample size permits (cap at 20)
-            n = len(df_pc_base)
+            n = len(values)
             if len(non_const_cols) <= max(3, min(n - 2, 20)):
                 subset_cols = list(non_const_cols)
             else:
-                subset_cols = self._select_columns_for_pc(df_pc_base, treatment, outcome)
+                subset_cols = self._select_columns_for_pc(
+                    df_pc_base, treatment, outcome, non_const_cols, n
+                )
             # Ensure treatment/outcome present
             if treatment not in subset_cols:
                 subset_cols = [treatment] + [c for c in subset_cols if c != treatment]
@@ -153,8 +178,16 @@ class CausalService:
 
             # Try PC; if it fails due to math domain issues, fallback to minimal graph
             try:
-                cg = self._learn_graph_pc(df_pc, alpha=alpha)
+                cg = self._learn_graph_pc(df_pc, subset_cols, alpha=alpha)
                 edges_directed, edges_viz = self._graph_to_edge_sets(cg)
+                # The analysis presupposes treatment -> outcome, so orient that
+                # pair for DoWhy when PC leaves it undirected. PC's node order is
+                # subset_cols, so the pair is two lookups in the endpoint matrix:
+                # equal nonzero marks at both ends mean -1/-1 or 1/1
+                t_idx, y_idx = subset_cols.index(treatment), subset_cols.index(outcome)
+                endpoint = cg.G.graph[t_idx, y_idx]
+                if endpoint != 0 and endpoint == cg.G.graph[y_idx, t_idx]:
+                    edges_directed.append({"source": treatment, "target": outcome})
             except ValueError as e:
                 logger.warning(
                     f"PC failed with ValueError: {e}. Falling back to minimal graph T->Y."
@@ -169,8 +202,7 @@ class CausalService:
                 edges_viz = list(edges_directed)
 
         # Use all available columns as graph nodes for visualization and modeling
-        graph_nodes = list(df_num.columns)
-        dot_graph = self._edges_to_dot(graph_nodes, edges_directed)
+        graph_nodes = cols
 
         # Build DoWhy model
         # Use the data corresponding to nodes in the learned/fallback graph
@@ -243,20 +275,25 @@ class CausalService:
             est_val = None
         if est_val is not None:
             try:
-                # Treatment descriptive stats
-                t_series = data_for_model[treatment].astype(float)
-                y_series = data_for_model[outcome].astype(float)
-                t_mean = float(t_series.mean())
-                y_mean = float(y_series.mean())
-                y_std = float(y_series.std(ddof=1)) if y_series.std(ddof=1) not in (None, 0, np.nan) else None
-                # If treatment appears binary, compute group means diff for context
+                # Treatment descriptive stats, on plain float arrays; the model
+                # data went through dropna, so there is no NaN to skip
+                t_values = data_for_model[treatment].to_numpy(dtype=np.float64)
+                y_values = data_for_model[outcome].to_numpy(dtype=np.float64)
+                t_mean = float(t_values.mean())
+                y_mean = float(y_values.mean())
+                # A single row has no sample variance; treat it like zero spread
+                y_var = float(y_values.var(ddof=1)) if len(y_values) > 1 else 0.0
+                y_std = math.sqrt(y_var) if y_var > 0 else None
+                # If treatment appears binary, compute group means diff for context;
+                # both group sizes and sums come from one bincount over a 0/1 mask
                 group_diff = None
-                if t_series.nunique(dropna=True) == 2:
-                    vals = sorted(t_series.dropna().unique())
-                    g0 = y_series[t_series == vals[0]]
-                    g1 = y_series[t_series == vals[1]]
-                    if len(g0) > 1 and len(g1) > 1:
-                        group_diff = float(g1.mean() - g0.mean())
+                levels = np.unique(t_values)
+                if levels.size == 2:
+                    in_upper = (t_values == levels[1]).astype(np.intp)
+                    counts = np.bincount(in_upper, minlength=2)
+                    if counts.min() > 1:
+                        sums = np.bincount(in_upper, weights=y_values, minlength=2)
+                        group_diff = float(sums[1] / counts[1] - sums[0] / counts[0])
                 pct_of_mean = (est_val / y_mean * 100.0) if y_mean not in (0, None, np.nan) else None
                 standardized = (est_val / y_std) if y_std not in (None, 0, np.nan) else None
                 effect_metrics = {
@@ -278,12 +315,11 @@ class CausalService:
                 effect_metrics = {"error": f"Effect size computation failed: {e}"}
 
         return {
-            "columns": list(df.columns),
+            "columns": cols,
             "learned_graph": {
                 "nodes": graph_nodes,
                 "edges": edges_viz,
                 "edges_directed": edges_directed,
-                "dot": dot_graph,
                 "algorithm": "PC",
                 "alpha": alpha,
             },
@@ -301,3 +337,7 @@ class CausalService:
             "refutation": str(refute),
             "effect_size": effect_metrics,
         }
+
+
+# Singleton
+causal_service = CausalService()
@@ -2,26 +2,73 @@
 Cleaning service for handling CSV data cleaning operations
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, Optional, Tuple
 import logging
 from fastapi import UploadFile
 import pandas as pd
-import io
 
-from ..core.csv_processor import CSVProcessor
+from ..core.csv_processor import UploadResultCache, csv_processor
 from ..core.exceptions import CSVProcessingError
 from ..config import settings
 
 logger = logging.getLogger(__name__)
 
+# Null- and duplicate-cleaned frames with their removal stats, keyed by upload
+# hash and remove_duplicates, so previewing a cleaning and then downloading the
+# result runs the row removal once
+cleaned_frame_cache = UploadResultCache(
+    settings.CLEANED_CSV_CACHE_SIZE,
+    max_bytes=settings.CLEANED_CSV_CACHE_MAX_MB * 1024 * 1024,
+    sizeof=lambda result: int(result[0].memory_usage(index=True).sum()),
+)
+
 
 class CleaningService:
     """Service for handling CSV cleaning operations"""
 
     def __init__(self):
-        self.csv_processor = CSVProcessor()
+        self.csv_processor = csv_processor
 
-    async def clean_csv_remove_nulls(self, file: UploadFile) -> Dict[str, Any]:
+    def _clean_pipeline(
+        self, file: UploadFile, remove_duplicates: bool
+    ) -> Tuple[pd.DataFrame, Dict[str, Any], Optional[Dict[str, Any]]]:
+        """
+        Remove null rows, and duplicate rows if requested, from an upload
+
+        Results are cached per file content; the returned frame and stats are
+        shared with other requests and must not be modified.
+
+        Args:
+            file: Uploaded CSV file
+            remove_duplicates: Whether to remove duplicate rows as well
+
+        Returns:
+            Tuple of (cleaned_df, null_stats, duplicate_stats)
+            - null_stats: Statistics about the null rows removed
+            - duplicate_stats: Statistics about the duplicate rows removed, or
+              None when duplicates were kept
+        """
+        digest = self.csv_processor.upload_digest(file)
+
+        def clean() -> Tuple[pd.DataFrame, Dict[str, Any], Optional[Dict[str, Any]]]:
+            # Flag null and duplicate rows on the Arrow table and filter it
+            # once, converting only the rows that are kept to pandas
+            table = self.csv_processor.generate_table_from_upload(file, digest)
+            cleaned_table, null_stats, duplicate_stats = (
+                self.csv_processor.remove_nulls_and_duplicates_table(
+                    table, remove_duplicates
+                )
+            )
+            # The filter builds a new table unless nothing was removed; only then
+            # is it the shared cached table, which must not be self-destructed
+            cleaned_df = self.csv_processor.table_to_df(
+                cleaned_table, self_destruct=cleaned_table is not table
+            )
+            return cleaned_df, null_stats, duplicate_stats
+
+        return cleaned_frame_cache.get_or_compute((digest, remove_duplicates), clean)
+
+    def clean_csv_remove_nulls(self, file: UploadFile) -> Dict[str, Any]:
         """
         Clean a CSV file by removing rows with null values
 
@@ -42,15 +89,9 @@ class CleaningService:
             CSVProcessingError: If file processing or cleaning fails
         """
         try:
-            # Read file content
-            content = await file.read()
-
-            # Process original CSV file to DataFrame
-            original_df = self.csv_processor.generate_df_from_csv(content)
-
             # Apply null row removal
-            cleaned_df, cleaning_stats = self.csv_processor.remove_null_rows(
-                original_df
+            cleaned_df, cleaning_stats, _ = self._clean_pipeline(
+                file, remove_duplicates=False
             )
 
             # Convert column types (numeric and date)
@@ -108,6 +149,7 @@ class CleaningService:
                         "conversion_details", {}
                     ),
                     "summary": type_conversion_stats.get("summary", ""),
+                    "memory_saved_bytes": type_conversion_stats["memory_saved_bytes"],
                 },
                 # Include null data if rows were removed
                 "null_data": (
@@ -138,45 +180,37 @@ class CleaningService:
             logger.error(f"Failed to clean CSV file {file.filename}: {e}")
             raise CSVProcessingError(f"Failed to clean CSV file: {str(e)}")
 
-    async def get_cleaned_csv_file(self, file: UploadFile) -> bytes:
+    def get_cleaned_csv_file(self, file: UploadFile) -> Iterator[bytes]:
         """
-        Get a cleaned CSV file with null rows removed as downloadable bytes
+        Get a cleaned CSV file with null rows removed as downloadable chunks
 
         Args:
             file: Uploaded CSV file
 
         Returns:
-            Bytes of the cleaned CSV file
+            Iterator over the cleaned CSV file's bytes, a block of rows at a time
 
         Raises:
             CSVProcessingError: If file processing or cleaning fails
         """
         try:
-            # Read file content
-            content = await file.read()
-
-            # Process original CSV file to DataFrame
-            original_df = self.csv_processor.generate_df_from_csv(content)
-
             # Apply null row removal
-            cleaned_df, _ = self.csv_processor.remove_null_rows(original_df)
+            cleaned_df, _, _ = self._clean_pipeline(file, remove_duplicates=False)
 
             # Convert column types (numeric and date)
             cleaned_df, _ = self.csv_processor.convert_column_types(cleaned_df)
 
-            # Convert back to CSV bytes
-            csv_buffer = io.StringIO()
-            cleaned_df.to_csv(csv_buffer, index=False)
-            csv_string = csv_buffer.getvalue()
+            # Serialized lazily, as the chunks are sent
+            csv_chunks = self.csv_processor.iter_csv_chunks(cleaned_df)
 
             logger.info(f"Successfully generated cleaned CSV file: {file.filename}")
-            return csv_string.encode("utf-8")
+            return csv_chunks
 
         except Exception as e:
             logger.error(f"Failed to generate cleaned CSV file {file.filename}: {e}")
             raise CSVProcessingError(f"Failed to generate cleaned CSV file: {str(e)}")
 
-    async def clean_csv_combined(
+    def clean_csv_combined(
         self, file: UploadFile, remove_duplicates: bool = True
     ) -> Dict[str, Any]:
         """
@@ -200,33 +234,19 @@ class CleaningService:
             CSVProcessingError: If file processing or cleaning fails
         """
         try:
-            # Read file content
-            content = await file.read()
-
-            # Process original CSV file to DataFrame
-            original_df = self.csv_processor.generate_df_from_csv(content)
-
-            # Store original row count
-            original_rows = len(original_df)
-
-            # Apply null row removal
-            cleaned_df, null_cleaning_stats = self.csv_processor.remove_null_rows(
-                original_df
+            # Apply null row removal, and duplicate row removal if requested
+            cleaned_df, null_cleaning_stats, duplicate_cleaning_stats = (
+                self._clean_pipeline(file, remove_duplicates)
             )
 
-            # Store intermediate stats
-            rows_after_null_removal = len(cleaned_df)
+            # Store original row count and intermediate stats
+            original_rows = null_cleaning_stats["rows_before"]
             null_rows_removed = null_cleaning_stats["rows_removed"]
 
-            # Apply duplicate row removal if requested
             duplicate_rows_removed = 0
             duplicate_rows_sample = []
 
-            if remove_duplicates:
-                # Remove duplicates
-                cleaned_df, duplicate_cleaning_stats = (
-                    self.csv_processor.remove_duplicate_rows(cleaned_df)
-                )
+            if duplicate_cleaning_stats is not None:
                 duplicate_rows_removed = duplicate_cleaning_stats["rows_removed"]
                 duplicate_rows_sample = duplicate_cleaning_stats.get(
                     "duplicate_rows_sample", []
@@ -310,46 +330,44 @@ class CleaningService:
             logger.error(f"Error in combined CSV cleaning: {e}")
             raise CSVProcessingError(f"Failed to clean CSV: {str(e)}")
 
-    async def get_combined_cleaned_csv_file(
-        self, file: UploadFile, remove_duplicates: bool = True
-    ) -> bytes:
+    def get_combined_cleaned_csv_file(
+        self, file: UploadFile, remove_duplicates: bool = True, output_format: str = "csv"
+    ) -> Iterator[bytes]:
         """
-        Process a CSV file to remove null values and optionally duplicate rows and return as CSV bytes
+        Process a CSV file to remove null values and optionally duplicate rows and return as CSV chunks
 
         Args:
             file: Uploaded CSV file
             remove_duplicates: Whether to remove duplicate rows (default: True)
+            output_format: "csv" for CSV text, or "arrow" for an Arrow IPC stream
 
         Returns:
-            bytes: CSV file content as bytes
+            Iterator over the CSV file content (or Arrow IPC stream), a block
+            of rows at a time; nothing is serialized until it is consumed
 
         Raises:
             CSVProcessingError: If file processing or cleaning fails
         """
         try:
-            # Read file content
-            content = await file.read()
+            # Apply null row removal, and duplicate row removal if requested;
+            # after a preview of the same file this is a cache hit
+            cleaned_df, _, _ = self._clean_pipeline(file, remove_duplicates)
 
-            # Process original CSV file to DataFrame
-            original_df = self.csv_processor.generate_df_from_csv(content)
-
-            # Apply null row removal
-            cleaned_df, _ = self.csv_processor.remove_null_rows(original_df)
-
-            # Apply duplicate row removal if requested
-            if remove_duplicates:
-                cleaned_df, _ = self.csv_processor.remove_duplicate_rows(cleaned_df)
-
-            # Convert cleaned DataFrame back to CSV bytes
-            csv_buffer = io.StringIO()
-            cleaned_df.to_csv(csv_buffer, index=False)
-            csv_string = csv_buffer.getvalue()
+            # Convert cleaned DataFrame back to CSV (or Arrow IPC) chunks
+            if output_format == "arrow":
+                file_chunks = self.csv_processor.iter_arrow_ipc_chunks(cleaned_df)
+            else:
+                file_chunks = self.csv_processor.iter_csv_chunks(cleaned_df)
 
             logger.info(
                 f"Successfully generated combined cleaned CSV file: {file.filename}"
             )
-            return csv_string.encode("utf-8")
+            return file_chunks
 
         except Exception as e:
             logger.error(f"Error generating deduplicated CSV file: {e}")
             raise CSVProcessingError(f"Failed to generate deduplicated CSV: {str(e)}")
+
+
+# Singleton
+cleaning_service = CleaningService()
@@ -7,8 +7,9 @@ import pandas as pd
 import numpy as np
 import logging
 import io
+from fastapi import UploadFile
 
-from ..core.csv_processor import CSVProcessor
+from ..core.csv_processor import csv_processor
 from ..core.exceptions import CSVProcessingError
 from ..config import settings
 
@@ -19,24 +20,27 @@ class AllRemovedRowsService:
     """Service for handling retrieval of all rows removed during cleaning"""
 
     def __init__(self):
-        self.csv_processor = CSVProcessor()
+        self.csv_processor = csv_processor
 
-    async def get_all_removed_rows(self, file_content: bytes) -> Dict[str, Any]:
+    def get_all_removed_rows(self, file: UploadFile) -> Dict[str, Any]:
         """
         Process a CSV file and get all rows that would be removed due to null values
 
         Args:
-            file_content: Raw bytes of CSV file
+            file: Uploaded CSV file
 
         Returns:
             Dictionary with removed rows data
         """
         try:
-            # Process original CSV file to DataFrame
-            df = self.csv_processor.generate_df_from_csv(file_content)
+            # Parse the upload straight from its spooled file
+            df = self.csv_processor.generate_df_from_upload(file)
 
-            # Get null rows without actually removing them
-            _, cleaning_stats = self.csv_processor.identify_null_rows(df)
+            # Get null rows without actually removing them; this endpoint
+            # exists to return every one of them, so lift the sample limit
+            _, cleaning_stats = self.csv_processor.identify_null_rows(
+                df, sample_limit=None
+            )
 
             # Collect results
             result = {
@@ -55,3 +59,7 @@ class AllRemovedRowsService:
         except Exception as e:
             logger.error(f"Failed to process CSV for removed rows: {e}")
             raise CSVProcessingError(f"Failed to process CSV: {str(e)}")
+
+
+# Singleton
+removed_rows_service = AllRemovedRowsService()
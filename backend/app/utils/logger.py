@@ -2,10 +2,17 @@
 Logging configuration utilities
 """
 
+import functools
 import logging
 import sys
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
+
+# Configuration each logger was last set up with, so repeat setup_logger calls
+# with the same settings leave its handlers alone
+_configured_loggers: Dict[str, Tuple[str, Optional[str], str]] = {}
+_configure_lock = threading.Lock()
 
 
 def setup_logger(
@@ -17,6 +24,9 @@ def setup_logger(
     """
     Set up a logger with consistent formatting
 
+    Idempotent: a logger already set up with the same settings is returned as
+    is, so its handlers are not torn down while other threads log through it.
+
     Args:
         name: Logger name
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
@@ -30,7 +40,20 @@ def setup_logger(
         format_string = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
     logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, level.upper()))
+    config = (level.upper(), log_file, format_string)
+    with _configure_lock:
+        if _configured_loggers.get(name) == config and logger.handlers:
+            return logger
+        _configure_logger(logger, *config)
+        _configured_loggers[name] = config
+    return logger
+
+
+def _configure_logger(
+    logger: logging.Logger, level: str, log_file: Optional[str], format_string: str
+) -> None:
+    """Replace the logger's level and handlers; called by setup_logger"""
+    logger.setLevel(getattr(logging, level))
 
     # Remove existing handlers to avoid duplicates
     logger.handlers.clear()
@@ -52,8 +75,6 @@ def setup_logger(
         file_handler.setFormatter(formatter)
         logger.addHandler(file_handler)
 
-    return logger
-
 
 def get_app_logger(name: str = "csv_ai_workflow") -> logging.Logger:
     """
@@ -80,7 +101,13 @@ class LoggerMixin:
     @property
     def logger(self) -> logging.Logger:
         """Get logger for this class"""
-        return get_app_logger(f"{self.__class__.__module__}.{self.__class__.__name__}")
+        return _class_logger(self.__class__)
+
+
+@functools.lru_cache(maxsize=None)
+def _class_logger(cls: type) -> logging.Logger:
+    """Application logger for a class, set up once per class"""
+    return get_app_logger(f"{cls.__module__}.{cls.__name__}")
 
 
 def log_function_call(func):
@@ -93,13 +120,22 @@ def log_function_call(func):
             return result
     """
 
+    # Set up once at decoration time rather than on every call
+    logger = get_app_logger(func.__module__)
+
     def wrapper(*args, **kwargs):
-        logger = get_app_logger(func.__module__)
-        logger.debug(f"Calling {func.__name__} with args={args}, kwargs={kwargs}")
+        # Checked per call, so level changes still apply; the args are only
+        # formatted when DEBUG records will actually be emitted
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(
+                "Calling %s with args=%s, kwargs=%s", func.__name__, args, kwargs
+            )
 
         try:
             result = func(*args, **kwargs)
-            logger.debug(f"{func.__name__} returned: {type(result).__name__}")
+            if debug:
+                logger.debug("%s returned: %s", func.__name__, type(result).__name__)
             return result
         except Exception as e:
             logger.error(f"{func.__name__} raised {type(e).__name__}: {str(e)}")
@@ -0,0 +1,57 @@
+"""
+Regression tests for the PyArrow CSV reader in CSVProcessor.
+
+Verifies that uploads parse the way pandas.read_csv parses them:
+1. Duplicate header names get pandas' ".1" suffixes
+2. Blank header names become "Unnamed: {position}"
+3. pandas' NA tokens ("None", "<NA>", ...) are read as missing
+4. Integers past the int64 range are read as uint64
+"""
+
+import sys
+import os
+import io
+
+# Add the backend app to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pandas as pd
+
+from app.core.csv_processor import CSVProcessor
+
+
+def _read_both(content: bytes):
+    return CSVProcessor.generate_df_from_csv(content), pd.read_csv(io.BytesIO(content))
+
+
+def test_duplicate_header_names():
+    """Test that repeated column names are made unique like pandas does."""
+    df, expected = _read_both(b"a,a,b,a.1\n1,2,3,4\n,5,6,7\n")
+
+    assert df.columns.tolist() == expected.columns.tolist() == ["a", "a.2", "b", "a.1"]
+    stats = CSVProcessor.compute_null_stats(df)
+    assert stats.counts_by_column == {"a": 1, "a.2": 0, "b": 0, "a.1": 0}
+
+
+def test_blank_header_names():
+    """Test that blank column names become "Unnamed: {position}"."""
+    df, expected = _read_both(b",id,\n0,1,x\n1,2,y\n")
+
+    assert df.columns.tolist() == expected.columns.tolist()
+    assert df.columns.tolist() == ["Unnamed: 0", "id", "Unnamed: 2"]
+
+
+def test_pandas_na_tokens():
+    """Test that "None" and "<NA>" count as missing values, as in pandas."""
+    df, expected = _read_both(b"a,b,c\n1,None,x\n2,3,<NA>\n")
+
+    assert df["b"].dtype == expected["b"].dtype == "float64"
+    assert df.isna().sum().tolist() == expected.isna().sum().tolist() == [0, 1, 1]
+
+
+def test_integers_past_int64_range():
+    """Test that integers above the int64 maximum keep their exact value."""
+    df, expected = _read_both(b"a,b\n9223372036854775808,1e19\n1,2\n")
+
+    assert df.dtypes.tolist() == expected.dtypes.tolist()
+    assert df["a"].tolist() == [9223372036854775808, 1]
@@ -6,26 +6,17 @@ import os
 
 
 def generate_diverse_dirty_data(n_rows=5000):
-    np.random.seed(123)
+    rng = np.random.default_rng(123)
 
-    # Sales column: mix of ints, floats, strings, negative, and None
-    sales = np.random.choice(
-        ["100", "200", "300.5", "four hundred", "-50", None, "1,000"], size=n_rows
-    )
-
-    # Price column: mix of currency symbols, floats, words, None
-    price = np.random.choice(
-        ["$10", "€20.75", "30", "40.5", "forty-five", None, "1,200.99"], size=n_rows
-    )
-
-    # Category: categorical with typos, spaces, case differences
-    category = np.random.choice(
-        ["A", "B", "C", "D", " a", "b ", "cC", "d"], size=n_rows
-    )
-
-    # Dates: multiple formats, invalid, missing
-    dates = np.random.choice(
-        [
+    columns = {
+        # Sales column: mix of ints, floats, strings, negative, and None
+        " Sales ": ["100", "200", "300.5", "four hundred", "-50", None, "1,000"],
+        # Price column: mix of currency symbols, floats, words, None
+        "Price($)": ["$10", "€20.75", "30", "40.5", "forty-five", None, "1,200.99"],
+        # Category: categorical with typos, spaces, case differences
+        "Category ": ["A", "B", "C", "D", " a", "b ", "cC", "d"],
+        # Dates: multiple formats, invalid, missing
+        "Date ": [
             "2021-01-01",
             "2021/02/01",
             "March 3, 2021",
@@ -34,24 +25,30 @@ def generate_diverse_dirty_data(n_rows=5000):
             None,
             "2021-12-31",
         ],
-        size=n_rows,
-    )
-
-    # Duplicate: ints, floats, strings
-    duplicate = np.random.choice([1, 2, 3, 3.0, "3", "three"], size=n_rows)
+        # Duplicate: ints, floats, strings
+        "Duplicate": [1, 2, 3, 3.0, "3", "three"],
+    }
 
+    # Draw the value codes for every column at once, then pick the values by
+    # fancy indexing into small object arrays
+    pool_sizes = np.array([len(values) for values in columns.values()])
+    codes = rng.integers(0, pool_sizes[:, None], size=(len(columns), n_rows))
     df = pd.DataFrame(
         {
-            " Sales ": sales,
-            "Price($)": price,
-            "Category ": category,
-            "Date ": dates,
-            "Duplicate": duplicate,
+            name: np.array(values, dtype=object)[column_codes]
+            for (name, values), column_codes in zip(columns.items(), codes)
         }
     )
 
     # Add intentional duplicates (to test deduplication)
-    df = pd.concat([df, df.sample(100, random_state=2)], ignore_index=True)
+    duplicate_rows = df.iloc[rng.choice(n_rows, size=100, replace=False)]
+    df = pd.concat([df, duplicate_rows], ignore_index=True)
+
+    # The text-only columns hold a handful of distinct strings, so store them
+    # as category: small integer codes instead of a string per row. Duplicate
+    # stays object, as category would merge 3 and 3.0 into one value
+    text_columns = [" Sales ", "Price($)", "Category ", "Date "]
+    df[text_columns] = df[text_columns].astype("category")
     return df
 
 
@@ -66,5 +63,12 @@ os.makedirs(test_data_dir, exist_ok=True)
 output_file = os.path.join(test_data_dir, "diverse_dirty_data.csv")
 df_diverse_dirty.to_csv(output_file, index=True)
 
+# Secondary Parquet copy: dictionary-encoded category columns, so loaders get
+# the codes back without re-parsing strings. Parquet needs one type per
+# column, so Duplicate is written as the same text the CSV holds
+parquet_file = os.path.join(test_data_dir, "diverse_dirty_data.parquet")
+df_diverse_dirty.astype({"Duplicate": str}).to_parquet(parquet_file, index=True)
+
 print(f"Dataset generated with shape: {df_diverse_dirty.shape}")
 print(f"File saved to: {output_file}")
+print(f"Parquet copy saved to: {parquet_file}")